@@ -1,5 +1,6 @@
 import argparse
 import asyncio
+import contextlib
 import errno
 import os
 import signal
@@ -9,7 +10,7 @@ import time
 
 from prompt_toolkit import print_formatted_text as print
 from prompt_toolkit.application import run_in_terminal
-from prompt_toolkit.completion import DynamicCompleter, ThreadedCompleter
+from prompt_toolkit.completion import DynamicCompleter
 from prompt_toolkit.enums import DEFAULT_BUFFER, EditingMode
 from prompt_toolkit.filters import HasFocus, IsDone
 from prompt_toolkit.history import FileHistory, InMemoryHistory
@@ -20,15 +21,18 @@ from prompt_toolkit.shortcuts import PromptSession, CompleteStyle
 from prompt_toolkit.styles import Style
 
 from .before_prompt import BeforePrompt
-from .completer import MidCompleter
+from .completer import DebouncedCompleter, MidCompleter
 from .command.interface import ProcessInputError
 from .context import Context
+from .daemon.server import serve
 from .editor.interactive import InteractiveEditor
 from .editor.noninteractive import NonInteractiveEditor
 from .editor.print_template import PrintTemplateEditor
+from .fanout import get_urls, run_fanout
 from .key_bindings import get_key_bindings
 from .menu.items import get_menu_items, process_menu_item
 from .pager import enable_pager
+from .script import run_script
 from .utils.shell import is_main_cli, switch_to_shell
 
 
@@ -36,26 +40,37 @@ class CLI:
     default_prompt = '[%h]%_n> '
 
     def __init__(self, url=None, user=None, password=None, timeout=None, command=None, interactive=None, menu=False,
-                 menu_item=None, mode=None, pager=False, print_template=False, stacks=False):
-        if command is None or interactive:
-            editor = InteractiveEditor()
-        elif print_template:
-            editor = PrintTemplateEditor()
-        else:
-            editor = NonInteractiveEditor()
-
+                 menu_item=None, mode=None, pager=False, print_template=False, stacks=False, script=None,
+                 continue_on_error=False, script_results=None, page_size=None, editor=None):
         if pager:
             enable_pager()
 
+        if editor is None:
+            editor = self.create_editor(command, interactive, print_template, script)
+
         self.context = Context(self, url=url, user=user, password=password, timeout=timeout,
-                               editor=editor, menu=menu, menu_item=menu_item, mode=mode, stacks=stacks)
+                               editor=editor, menu=menu, menu_item=menu_item, mode=mode, stacks=stacks,
+                               page_size=page_size)
 
         self.command = command
+        self.script = script
+        self.continue_on_error = continue_on_error
+        self.script_results = script_results
         self.completer = MidCompleter(self.context)
 
         self.last_kernel_message = None
         self.loop = None
 
+    @staticmethod
+    def create_editor(command, interactive, print_template, script):
+        if (command is None and script is None) or interactive:
+            return InteractiveEditor()
+        elif print_template:
+            return PrintTemplateEditor()
+        else:
+            # When the script is read from stdin, there is no stdin left to read YAML arguments from
+            return NonInteractiveEditor(read_stdin=script != "-")
+
     def _build_menu(self, menu_items):
         def get_message():
             prompt = '\n'.join([
@@ -77,7 +92,7 @@ class CLI:
         return prompt_app
 
     def _build_cli(self, history):
-        before_prompt = BeforePrompt(self.context.get_client)
+        before_prompt = BeforePrompt(self.context.interface_status)
         before_prompt.start()
 
         def get_message():
@@ -93,7 +108,7 @@ class CLI:
                 'before_prompt': 'fg:ansigreen',
             }),
             complete_style=CompleteStyle.COLUMN,
-            completer=ThreadedCompleter(
+            completer=DebouncedCompleter(
                 DynamicCompleter(lambda: self.completer)
             ),
             complete_while_typing=True,
@@ -179,7 +194,16 @@ class CLI:
         self.context.reload()
         self.loop.call_soon_threadsafe(self._repaint_cli)
 
+    def _run_script(self):
+        with contextlib.ExitStack() as stack:
+            lines = sys.stdin if self.script == "-" else stack.enter_context(open(self.script))
+            results = stack.enter_context(open(self.script_results, "w")) if self.script_results else None
+            return run_script(self.context, lines, not self.continue_on_error, results)
+
     def run(self):
+        if self.script is not None:
+            sys.exit(self._run_script())
+
         if self.command is not None:
             try:
                 self.context.process_input(self.command)
@@ -271,30 +295,75 @@ def main_console():
 
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument('--url')
+    parser.add_argument('--url', action='append',
+                        help='Middleware URL (may be specified multiple times to execute -c/--command on all of them)')
+    parser.add_argument('--hosts-file',
+                        help='Execute -c/--command on all the middleware URLs listed in this file (one per line)')
+    parser.add_argument('--workers', type=int, default=8,
+                        help='Maximum number of hosts to execute -c/--command on concurrently')
     parser.add_argument('--user')
     parser.add_argument('--password')
     parser.add_argument('--timeout', type=int, default=1200,
                         help='Timeout for executing non-job commands (in seconds)')
     parser.add_argument('-c', '--command',
                         help='Execute single command')
+    parser.add_argument('--script',
+                        help='Execute commands from the file (one command per line, `-` for stdin)')
+    parser.add_argument('--continue-on-error', action='store_true',
+                        help='If --script is specified, do not stop after the first failed command')
+    parser.add_argument('--script-results',
+                        help='If --script is specified, write each command exit status to this file as JSON lines')
     parser.add_argument('-i', '--interactive', action='store_true',
-                        help='If -c/--command is specified, execute it in interactive mode')
+                        help='If -c/--command or --script is specified, execute it in interactive mode')
     parser.add_argument('--menu', action='store_true',
                         help='Show shortcut menu')
     parser.add_argument('--menu-item',
                         help='Activate shortcut menu item')
     parser.add_argument('-m', '--mode',
-                        help='Output display mode')
+                        help='Output display mode (csv, json, ndjson or table)')
     parser.add_argument('--pager', action='store_true',
                         help='Use pager to display commands output')
+    parser.add_argument('--page-size', type=int,
+                        help='Retrieve query results in pages of this many rows and display them as they arrive')
     parser.add_argument('--print-template', action='store_true',
                         help='If -c/--command is specified, print its YAML template instead of executing it')
     parser.add_argument('--stacks', action='store_true',
                         help='Display errors stack trace')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Run a resident server that executes commands forwarded by `cli_client` using a warm '
+                             'context (only --url, --user, --password and --timeout apply to the server itself)')
     args = parser.parse_args()
 
-    cli = CLI(**args.__dict__)
+    if args.command is not None and args.script is not None:
+        parser.error('-c/--command and --script are mutually exclusive')
+
+    urls = get_urls(args)
+    if len(urls) > 1 or args.hosts_file:
+        if args.command is None:
+            parser.error('-c/--command is required when multiple hosts are specified')
+        if args.daemon or args.interactive or args.script or args.menu or args.menu_item or args.print_template:
+            parser.error('Multiple hosts are only supported for non-interactive -c/--command')
+
+        # stdin (YAML arguments) can only be read once, so all the hosts share one editor
+        editor = CLI.create_editor(args.command, False, False, None)
+        sys.exit(run_fanout(
+            lambda url: CLI(url=url, user=args.user, password=args.password, timeout=args.timeout,
+                            command=args.command, mode=args.mode, stacks=args.stacks, editor=editor),
+            urls, args.command, args.workers, args.pager,
+        ))
+
+    url = urls[0] if urls else None
+
+    if args.daemon:
+        cli = CLI(url=url, user=args.user, password=args.password, timeout=args.timeout)
+        serve(cli, parser, args)
+        return
+
+    kwargs = args.__dict__.copy()
+    for k in ['daemon', 'hosts_file', 'workers']:
+        kwargs.pop(k)
+    kwargs['url'] = url
+    cli = CLI(**kwargs)
     cli.run()
 
 
@@ -0,0 +1,62 @@
+# -*- coding=utf-8 -*-
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["CallCache", "is_read_only_method"]
+
+
+def is_read_only_method(name):
+    """
+    Best-effort check (based on the middleware method naming conventions) that calling a method does not modify
+    anything.
+    """
+    method = name.rsplit(".", 1)[-1]
+    return method in ("query", "get_instance", "config") or method.endswith("_choices")
+
+
+class CallCache:
+    """
+    Caches middleware data (i.e. enum completion sources) per service.
+
+    Values expire after `ttl` seconds and all the values of a service are invalidated when the CLI calls a method of
+    that service that may modify it.
+    """
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+
+        self.lock = threading.Lock()
+        # service -> key -> (expires_at, value)
+        self.data = {}
+
+    def get(self, service, key, compute):
+        """
+        Returns the value cached for the `service` and `key` or computes it with `compute()` (and caches it).
+        """
+        now = time.monotonic()
+        with self.lock:
+            try:
+                expires_at, value = self.data[service][key]
+            except KeyError:
+                pass
+            else:
+                if now < expires_at:
+                    return value
+
+        value = compute()
+
+        with self.lock:
+            self.data.setdefault(service, {})[key] = (now + self.ttl, value)
+
+        return value
+
+    def invalidate(self, service):
+        with self.lock:
+            self.data.pop(service, None)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
@@ -0,0 +1,100 @@
+# -*- coding=utf-8 -*-
+import contextlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ClientPool", "ClientPoolTimeout"]
+
+
+class ClientPoolTimeout(TimeoutError):
+    pass
+
+
+class ClientPool:
+    """
+    Keeps up to `size` authenticated middleware connections open and lends them to the callers.
+
+    A connection that was idle for longer than `health_check_interval` seconds (or that was in use when an exception
+    was raised) is pinged before it is lent again and is transparently replaced with a new one if it is dead.
+
+    If all the connections are in use for longer than `acquire_timeout` seconds, `ClientPoolTimeout` is raised instead
+    of waiting forever.
+    """
+
+    def __init__(self, connect, size=4, health_check_interval=30, acquire_timeout=60):
+        self.connect = connect
+        self.size = size
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+
+        self.lock = threading.Lock()
+        self.semaphore = threading.BoundedSemaphore(size)
+        self.idle = []
+        self.local = threading.local()
+
+    @contextlib.contextmanager
+    def client(self):
+        if (c := getattr(self.local, "client", None)) is not None:
+            # Nested `get_client()` calls within one thread share the connection instead of taking another slot
+            # (otherwise `size` nested calls would dead-lock).
+            yield c
+            return
+
+        if not self.semaphore.acquire(timeout=self.acquire_timeout):
+            raise ClientPoolTimeout(f"Timed out waiting for a middleware connection: all {self.size} connections "
+                                    f"have been in use for {self.acquire_timeout} seconds")
+
+        try:
+            c = self._acquire()
+            self.local.client = c
+            healthy = False
+            try:
+                yield c
+                healthy = True
+            finally:
+                self.local.client = None
+                with self.lock:
+                    self.idle.append((c, time.monotonic() if healthy else None))
+        finally:
+            self.semaphore.release()
+
+    def close(self):
+        with self.lock:
+            idle, self.idle = self.idle, []
+
+        for c, last_used in idle:
+            self._close(c)
+
+    def _acquire(self):
+        while True:
+            with self.lock:
+                if not self.idle:
+                    break
+
+                c, last_used = self.idle.pop()
+
+            if last_used is not None and time.monotonic() - last_used < self.health_check_interval:
+                return c
+
+            if self._is_alive(c):
+                return c
+
+            logger.debug("Discarding dead middleware connection %r", c)
+            self._close(c)
+
+        return self.connect()
+
+    def _is_alive(self, c):
+        try:
+            return c.call("core.ping") == "pong"
+        except Exception:
+            return False
+
+    def _close(self, c):
+        try:
+            c.close()
+        except Exception:
+            pass
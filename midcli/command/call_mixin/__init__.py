@@ -1,5 +1,5 @@
 # -*- coding=utf-8 -*-
-import copy
+import contextlib
 import logging
 import os
 import shutil
@@ -10,6 +10,7 @@ import requests
 
 from truenas_api_client import ClientException, ValidationErrors
 
+from midcli.call_cache import is_read_only_method
 from midcli.command.interface import ProcessInputError
 from midcli.middleware import format_error, format_validation_errors
 from midcli.pager import echo_via_pager
@@ -21,6 +22,8 @@ __all__ = ["CallMixin"]
 
 class CallMixin:
     output_processors = []
+    # Services (besides the called method's own service) whose cached data calling this command modifies
+    invalidated_services = []
 
     def __init__(self, *args, **kwargs):
         self.job_last_printed_description = ""
@@ -30,15 +33,31 @@ class CallMixin:
 
     def _process_call_args(self, args):
         """
-        Transforms args before passing them to the middleware (e.g. rename poorly named arguments)
+        Transforms args before passing them to the middleware (e.g. rename poorly named arguments). Must not modify
+        `args` in-place (the editor passes the same values again if the call fails).
         """
         return args
 
-    def call(self, name, *args, job=False, output_processor=None, pipe_output=None, raise_=False):
+    def call(self, name, *args, job=False, output_processor=None, pipe_output=None, raise_=False,
+             output_processors=None):
+        rv = self._call(name, *args, job=job, output_processor=output_processor, pipe_output=pipe_output,
+                        raise_=raise_, output_processors=output_processors)
+
+        self._handle_output(rv)
+
+        return rv
+
+    def _call(self, name, *args, job=False, output_processor=None, pipe_output=None, raise_=False,
+              output_processors=None):
+        """
+        Same as `call` but returns the result instead of displaying it.
+
+        `output_processors` override the command `output_processors`.
+        """
         try:
-            args = self._process_call_args(copy.deepcopy(args))
+            args = self._process_call_args(args)
 
-            with self.context.get_client() as c:
+            with self.context.get_client() as c, self._invalidating_call_cache(name):
                 if job and pipe_output is not None:
                     if self.context.url and self.context.url.startswith(("ws://", "wss://")):
                         schema, rest = self.context.url.split("://")
@@ -61,7 +80,7 @@ class CallMixin:
                 else:
                     rv = c.call(name, *args, job=job, callback=self._job_callback)
 
-            for op in self.output_processors:
+            for op in self.output_processors if output_processors is None else output_processors:
                 rv = op(self.context, rv)
 
             if output_processor is not None:
@@ -74,10 +93,23 @@ class CallMixin:
                 raise ProcessInputError(error)
             else:
                 raise ProcessInputError(traceback.format_exc())
-        else:
-            self._handle_output(rv)
 
-            return rv
+        return rv
+
+    @contextlib.contextmanager
+    def _invalidating_call_cache(self, name):
+        """
+        Invalidates the cached data of the services the called method may modify (even if the call fails).
+        """
+        try:
+            yield
+        finally:
+            if not is_read_only_method(name):
+                for service in [name.rsplit(".", 1)[0]] + self.invalidated_services:
+                    self.context.call_cache.invalidate(service)
+
+                if name.startswith("interface."):
+                    self.context.interface_status.refresh()
 
     def _call_util(self, method, *args, **kwargs):
         with self.context.get_client() as c:
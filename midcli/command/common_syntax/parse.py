@@ -3,6 +3,7 @@ from collections import namedtuple
 from dataclasses import dataclass
 import functools
 import logging
+import os
 import re
 import typing
 
@@ -11,14 +12,19 @@ import pyparsing as pp
 from midcli.utils.pyparsing.exception import format_pyparsing_exception
 from midcli.utils.pyparsing.json import jsonValue
 
+from .scanner import scan_arguments
+
 logger = logging.getLogger(__name__)
 
 __all__ = ["AutocompleteName", "AutocompleteValue", "ParseError", "RE_SIMPLE_STRING", "CommonSyntaxCommandArguments",
-           "parse_arguments", "get_autocomplete"]
+           "parse_arguments", "get_autocomplete", "ArgumentsTokenizer"]
 
 
 AutocompleteName = namedtuple("AutocompleteName", ["args", "kwargs", "name"])
 AutocompleteValue = namedtuple("AutocompleteValue", ["name", "value"])
+# `end` is the position of the whitespace that follows the token, `next` is the position of the next non-whitespace
+# character.
+ArgumentsToken = namedtuple("ArgumentsToken", ["end", "next", "name", "value"])
 
 
 class ParseError(Exception):
@@ -62,8 +68,13 @@ command = (
 
 autocomplete = arguments + pp.restOfLine.setResultsName("rest")
 
+# The same as `arguments`, but one token at a time
+arg_token = pp.Located(arg + pp.FollowedBy(pp.White()))
+kwarg_token = pp.Located(kwarg + pp.FollowedBy(pp.White()))
+
 RE_ARG = re.compile(r"\s*(?P<name>[a-z0-9_]+)$", flags=re.IGNORECASE)
 RE_KWARG = re.compile(r"\s*(?P<name>[a-z0-9_]+)\s*=\s*(?P<value>.*)$", flags=re.IGNORECASE)
+RE_WHITESPACE = re.compile(r"[ \t\r\n]*")
 
 
 @dataclass
@@ -81,22 +92,26 @@ def parse_arguments(text):
     output = None
 
     if text is not None:
-        try:
-            result = dict(command.parseString(text + " ", parseAll=True).items())
-        except pp.ParseException as e:
-            raise ParseError(format_pyparsing_exception(e))
+        if (scanned := scan_arguments(text)) is not None:
+            args, kwargs, interactive, output = scanned
+        else:
+            # Uncommon or invalid input, pyparsing grammar will produce the result or a detailed error message
+            try:
+                result = dict(command.parseString(text + " ", parseAll=True).items())
+            except pp.ParseException as e:
+                raise ParseError(format_pyparsing_exception(e))
 
-        if "arg_value" in result:
-            args = list(map(get_value, result["arg_value"]))
+            if "arg_value" in result:
+                args = list(map(get_value, result["arg_value"]))
 
-        if "kwarg_name" in result:
-            kwargs = dict(zip(result["kwarg_name"], map(get_value, result["kwarg_value"])))
+            if "kwarg_name" in result:
+                kwargs = dict(zip(result["kwarg_name"], map(get_value, result["kwarg_value"])))
 
-        if "interactive" in result:
-            interactive = True
+            if "interactive" in result:
+                interactive = True
 
-        if "output" in result:
-            output = result["output"]
+            if "output" in result:
+                output = result["output"]
 
     return CommonSyntaxCommandArguments(args, kwargs, interactive, output)
 
@@ -110,21 +125,101 @@ def get_value(value):
         return list(value)
 
 
-def get_autocomplete(text):
+class ArgumentsTokenizer:
+    """
+    Splits the arguments line into `arg`/`kwarg` tokens the same way the `autocomplete` grammar does.
+
+    Completion re-parses the whole line on every keystroke, so the tokens of the previous line are remembered and the
+    ones that lie within the unchanged prefix of the new line are reused. Only the edited tail is parsed again.
+    """
+
+    def __init__(self):
+        # (text, tokens) tuple is replaced atomically as completions may be requested from different threads
+        self.previous = ("", [])
+
+    def tokenize(self, text):
+        """
+        Returns `(tokens, rest)` for the `text` (that must already have tabs expanded and a trailing space appended)
+        or raises `ParseError` when the `autocomplete` grammar would fail.
+        """
+        previous_text, previous_tokens = self.previous
+
+        common_prefix_length = len(os.path.commonprefix([previous_text, text]))
+        tokens = []
+        for token in previous_tokens:
+            # A token is only known to be parsed identically if everything it depends on (including the lookahead
+            # for `=` that follows it) is unchanged.
+            if token.next >= common_prefix_length:
+                break
+
+            tokens.append(token)
+
+        loc = tokens[-1].end if tokens else 0
+        while True:
+            # kwargs can't be followed by args
+            if not tokens or tokens[-1].name is None:
+                try:
+                    result = arg_token.parseString(text[loc:])
+                except pp.ParseException:
+                    pass
+                else:
+                    loc = self._add_token(tokens, text, loc, result, None, result[1]["arg_value"][0])
+                    continue
+
+            try:
+                result = kwarg_token.parseString(text[loc:])
+            except pp.ParseException:
+                break
+
+            loc = self._add_token(tokens, text, loc, result, result[1]["kwarg_name"][0],
+                                  result[1]["kwarg_value"][0])
+
+        if not tokens or tokens[-1].name is None:
+            # Empty `ZeroOrMore(kwarg)` consumes the leading whitespace
+            loc = RE_WHITESPACE.match(text, loc).end()
+
+        rest, newline, tail = text[loc:].partition("\n")
+        if tail.strip():
+            raise ParseError(f"Unexpected text after line end: {tail!r}")
+
+        self.previous = (text, tokens)
+        return tokens, rest
+
+    def _add_token(self, tokens, text, loc, result, name, value):
+        end = loc + result[2]
+        tokens.append(ArgumentsToken(end, RE_WHITESPACE.match(text, end).end(), name, value))
+        return end
+
+
+autocomplete_tokenizer = ArgumentsTokenizer()
+
+
+def parse_autocomplete(text):
+    """
+    Returns `autocomplete` grammar parse results for the `text` or `None` if it does not match.
+    """
     try:
-        result = dict(autocomplete.parseString(text + " ", parseAll=True).items())
-    except pp.ParseException:
+        tokens, rest = autocomplete_tokenizer.tokenize((text + " ").expandtabs())
+    except ParseError:
         return None
 
-    result["rest"] = result["rest"][:-1]
+    result = {}
+    if arg_tokens := [token for token in tokens if token.name is None]:
+        result["arg_value"] = [get_value(token.value) for token in arg_tokens]
+    if kwarg_tokens := [token for token in tokens if token.name is not None]:
+        result["kwarg_name"] = [token.name for token in kwarg_tokens]
+        result["kwarg_value"] = [get_value(token.value) for token in kwarg_tokens]
+
+    result["rest"] = rest[:-1]
     if not result["rest"]:
         del result["rest"]
 
-    if "arg_value" in result:
-        result["arg_value"] = list(map(get_value, result["arg_value"]))
+    return result
 
-    if "kwarg_value" in result:
-        result["kwarg_value"] = list(map(get_value, result["kwarg_value"]))
+
+def get_autocomplete(text):
+    if (result := parse_autocomplete(text)) is None:
+        return None
 
     args = len(result.get("arg_value", []))
     kwargs = list(result.get("kwarg_name", []))
@@ -0,0 +1,185 @@
+# -*- coding=utf-8 -*-
+import json
+import logging
+import re
+import string
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["scan_arguments"]
+
+# These must match the pyparsing elements in `parse.py`
+RE_NAME = re.compile(r"([A-Za-z][A-Za-z0-9_]*)[ \r\n]*=")
+RE_OCT = re.compile(r"0o[0-7]+", flags=re.IGNORECASE)
+RE_HEX = re.compile(r"0x[0-9a-f]+", flags=re.IGNORECASE)
+RE_STRING = re.compile(r"[a-z./_@][a-z0-9./_@]*", flags=re.IGNORECASE)
+RE_INTEGER = re.compile(r"[+-]?[0-9]+")
+RE_REAL = re.compile(r"[+-]?[0-9]+\.[0-9]+")
+RE_JSON_STRING = re.compile(r'"(?:[^"\n\r\\]|\\.)*"')
+RE_TOKEN = re.compile(r"[^ \r\n,]+")
+RE_WHITESPACE = re.compile(r"[ \r\n]*")
+KEYWORDS = {"true": True, "false": False, "null": None}
+KEYWORD_CHARS = set(string.ascii_letters + string.digits + "_$")
+PRINTABLES = set(c for c in string.printable if c not in string.whitespace)
+WHITESPACE = set(" \r\n")
+
+json_decoder = json.JSONDecoder(parse_constant=lambda constant: Fallback.raise_())
+
+
+class Fallback(Exception):
+    """
+    Raised when the input is not one of the common cases the scanner handles (including all the invalid inputs).
+    """
+
+    @classmethod
+    def raise_(cls):
+        raise cls()
+
+
+def scan_arguments(text):
+    """
+    Single-pass scanner for the common syntax arguments line.
+
+    Returns `(args, kwargs, interactive, output)` exactly as the pyparsing `command` grammar would or `None` if the
+    line is not a common case (or is invalid) and should be parsed with pyparsing.
+    """
+    try:
+        return _scan_arguments(text.expandtabs() + " ")
+    except Fallback:
+        return None
+
+
+def _scan_arguments(text):
+    args = []
+    kwargs = {}
+    interactive = False
+    output = None
+
+    loc = 0
+    while True:
+        start = _skip_whitespace(text, loc)
+        if start == len(text) or text.startswith(("--", ">"), start):
+            break
+
+        if m := RE_NAME.match(text, start):
+            loc, value = _scan_value(text, m.end())
+            kwargs[m.group(1)] = value
+        else:
+            if kwargs:
+                # Positional argument after keyword argument
+                raise Fallback()
+
+            # Positional argument value is parsed right after the previous token (without skipping the whitespace)
+            loc, value = _scan_value(text, loc)
+            if text.startswith("=", _skip_whitespace(text, loc)):
+                raise Fallback()
+
+            args.append(value)
+
+    loc = _skip_whitespace(text, loc)
+    if text.startswith("--", loc):
+        interactive = True
+        loc = _skip_whitespace(text, loc + 2)
+
+    if text.startswith(">", loc):
+        loc = _skip_whitespace(text, loc + 1)
+        end = loc
+        while end < len(text) and text[end] in PRINTABLES:
+            end += 1
+
+        if end == loc:
+            raise Fallback()
+
+        output = text[loc:end]
+        loc = end
+
+    if _skip_whitespace(text, loc) != len(text):
+        raise Fallback()
+
+    return args, kwargs, interactive, output
+
+
+def _scan_value(text, loc):
+    items = []
+    while True:
+        start = _skip_whitespace(text, loc)
+        value, end, simple = _scan_scalar(text, start)
+        if simple and start != loc and (items or text.startswith(",", end)):
+            # oct, hex and string list items are parsed without skipping the leading whitespace
+            raise Fallback()
+
+        items.append(value)
+
+        if not text.startswith(",", end):
+            break
+
+        loc = end + 1
+
+    if end == len(text) or text[end] not in WHITESPACE:
+        raise Fallback()
+
+    if len(items) == 1:
+        return end, items[0]
+
+    return end, items
+
+
+def _scan_scalar(text, loc):
+    """
+    Returns `(value, end, simple)` where `simple` is true for oct, hex and string values.
+    """
+    if text.startswith('"', loc):
+        if m := RE_JSON_STRING.match(text, loc):
+            try:
+                return json.loads(m.group(0)), m.end(), False
+            except ValueError:
+                pass
+
+        raise Fallback()
+
+    if text.startswith(("[", "{"), loc):
+        try:
+            value, end = json_decoder.raw_decode(text, loc)
+        except ValueError:
+            raise Fallback()
+
+        return value, end, False
+
+    if not (m := RE_TOKEN.match(text, loc)):
+        raise Fallback()
+
+    token = m.group(0)
+    end = m.end()
+
+    if RE_OCT.fullmatch(token):
+        return int(token[2:], 8), end, True
+
+    if RE_HEX.fullmatch(token):
+        return int(token[2:], 16), end, True
+
+    if RE_INTEGER.fullmatch(token):
+        return int(token), end, False
+
+    if RE_REAL.fullmatch(token):
+        return float(token), end, False
+
+    if token in KEYWORDS:
+        return KEYWORDS[token], end, False
+
+    for keyword in KEYWORDS:
+        if token.startswith(keyword) and token[len(keyword)] not in KEYWORD_CHARS:
+            # JSON keyword followed by some string characters
+            raise Fallback()
+
+    if token[0] == "." and token[1:2].isdigit():
+        # Looks like a JSON number
+        raise Fallback()
+
+    if RE_STRING.fullmatch(token):
+        return token, end, True
+
+    raise Fallback()
+
+
+def _skip_whitespace(text, loc):
+    return RE_WHITESPACE.match(text, loc).end()
@@ -1,5 +1,4 @@
 # -*- coding=utf-8 -*-
-import copy
 import logging
 
 from truenas_api_client import ClientException, ValidationErrors
@@ -22,7 +21,7 @@ class CallArgsError(ValueError):
 
 class GenericCallCommand(CallMixin, CommonSyntaxCommand):
     def __init__(self, *args, method=None, splice_kwargs=None, **kwargs):
-        self.method = self._process_method(copy.deepcopy(method))
+        self.method = self._process_method(method)
         self.splice_kwargs = splice_kwargs
 
         self.arguments = []
@@ -32,7 +31,8 @@ class GenericCallCommand(CallMixin, CommonSyntaxCommand):
 
     def _process_method(self, method):
         """
-        Transforms middleware method definition (e.g. rename poorly named arguments)
+        Transforms middleware method definition (e.g. rename poorly named arguments). `method` is shared with the
+        context and must not be modified in-place (use `midcli.utils.cow`).
         """
         return method
 
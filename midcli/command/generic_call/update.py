@@ -1,9 +1,9 @@
 # -*- coding=utf-8 -*-
-import copy
 import logging
 
 from midcli.command.interface import ProcessInputError
 from midcli.editor.yaml.object import property_to_yaml_arg
+from midcli.utils.cow import set_path
 
 from . import GenericCallCommand
 
@@ -26,12 +26,6 @@ class UpdateCommand(GenericCallCommand):
         return super()._call_args(args, kwargs)
 
     def _run_with_editor(self, args):
-        method = copy.deepcopy(self.method)
-
-        schema = method["accepts"][1]
-        for property in schema["properties"].values():
-            property["_required_"] = False
-
         if len(args.args) == 0:
             key = self.method["accepts"][0]["_name_"]
             try:
@@ -43,10 +37,16 @@ class UpdateCommand(GenericCallCommand):
         object = self._call_util(".".join(self.method["name"].split(".")[:-1] + ["get_instance"]),
                                  self._get_instance_call_arg(args.args[0]))
 
-        for name, property in schema["properties"].items():
+        properties = {}
+        for name, property in self.method["accepts"][1]["properties"].items():
+            property = {**property, "_required_": False}
             if name in object:
                 property["default"] = property_to_yaml_arg(property, object[name])
 
+            properties[name] = property
+
+        method = set_path(self.method, ["accepts", 1, "properties"], properties)
+
         values = [key, {}]
         errors = []
 
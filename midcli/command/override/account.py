@@ -1,4 +1,5 @@
 # -*- coding=utf-8 -*-
+import collections.abc
 import errno
 import logging
 
@@ -8,9 +9,10 @@ from midcli.command.common_syntax.argument import EnumArgument
 from midcli.command.generic_call import GenericCallCommand
 from midcli.command.generic_call.update import UpdateCommand
 from midcli.command.query.command import QueryCommand
+from midcli.utils.cow import set_path
 from midcli.utils.lang import undefined
 
-from .utils import remove_fields, rows_processor
+from .utils import lookup_table, remove_fields, rows_processor
 
 logger = logging.getLogger(__name__)
 
@@ -22,30 +24,40 @@ remove_id = remove_fields("id")
 
 
 def get_groups(context):
-    with context.get_client() as c:
-        return [g["group"] for g in c.call("group.query", [], {"select": ["group"], "order_by": ["group"]})]
+    def query():
+        with context.get_client() as c:
+            return [g["group"] for g in c.call("group.query", [], {"select": ["group"], "order_by": ["group"]})]
 
+    return context.call_cache.get("group", "names", query)
 
-@rows_processor
-def patch_users(context, users):
-    with context.get_client() as c:
-        groups = {
-            group["id"]: group["group"]
-            for group in c.call("group.query", [], {"select": ["id", "group"]})
-        }
 
+@rows_processor(requires=["group"], produces=["group"])
+def patch_users(context, users):
     for user in users:
-        user["group"].pop("id")
+        if "group" not in user:
+            continue
+
+        user["group"].pop("id", None)
         user["group"] = {k[len("bsdgrp_"):]: v for k, v in user["group"].items()}
 
-        user["groups"] = [groups[id] for id in user["groups"]]
+
+@rows_processor(requires=["groups"], produces=["groups"])
+def patch_users_groups(context, users):
+    groups = lookup_table(context, "group", "id", "group", {id for user in users for id in user.get("groups", [])})
+
+    for user in users:
+        if "groups" in user:
+            user["groups"] = [groups[id] for id in user["groups"]]
 
 
 class AccountQueryCommand(QueryCommand):
-    output_processors = [remove_id, patch_users]
+    output_processors = [remove_id, patch_users, patch_users_groups]
 
 
 class AccountCommandMixin:
+    # User primary group may be created or deleted together with the user
+    invalidated_services = ["group"]
+
     def _process_key(self, key):
         with self.context.get_client() as c:
             if isinstance(key, str):
@@ -67,39 +79,75 @@ class AccountCommandMixin:
                 )])
 
     def _process_value(self, value):
+        """
+        Returns a copy of `value` with group names and gids replaced with group ids.
+        """
+        keys = []
+        if "group" in value:
+            keys.append(value["group"])
+        if "groups" in value:
+            keys.extend(value["groups"])
+
+        if not keys:
+            return value
+
         with self.context.get_client() as c:
-            if "group" in value:
+            groups = self._get_groups(c, keys)
+
+        value = value.copy()
+        if "group" in value:
+            try:
+                value["group"] = groups[value["group"]]
+            except (KeyError, TypeError):
+                raise ValidationErrors([(
+                    f'{self.method["accepts"][0]["_name_"]}.group',
+                    f"Group {value['group']!r} does not exist",
+                    errno.ENOENT,
+                )])
+
+        if "groups" in value:
+            value["groups"] = list(value["groups"])
+            for i, group in enumerate(value["groups"]):
                 try:
-                    value["group"] = self._get_group(c, value["group"])
-                except ClientException:
+                    value["groups"][i] = groups[group]
+                except (KeyError, TypeError):
                     raise ValidationErrors([(
-                        f'{self.method["accepts"][0]["_name_"]}.group',
-                        f"Group {value['group']!r} does not exist",
+                        f'{self.method["accepts"][0]["_name_"]}.groups.{i}',
+                        f"Group {group!r} does not exist",
                         errno.ENOENT,
                     )])
 
-            if "groups" in value:
-                for i, group in enumerate(value["groups"]):
-                    try:
-                        value["groups"][i] = self._get_group(c, group)
-                    except ClientException:
-                        raise ValidationErrors([(
-                            f'{self.method["accepts"][0]["_name_"]}.groups.{i}',
-                            f"Group {group!r} does not exist",
-                            errno.ENOENT,
-                        )])
-
-    def _get_group(self, c, key):
-        if isinstance(key, str):
-            filter = [["group", "=", key]]
+        return value
+
+    def _get_groups(self, c, keys):
+        """
+        Resolves group names and gids to group ids with a single `group.query` call. Keys that do not exist (or can't
+        be looked up at all, i.e. `null` or lists) are omitted from the result.
+        """
+        keys = [key for key in keys if isinstance(key, collections.abc.Hashable)]
+        names = list(dict.fromkeys(key for key in keys if isinstance(key, str)))
+        gids = list(dict.fromkeys(key for key in keys if not isinstance(key, str) and key is not None))
+
+        filters = []
+        if names:
+            filters.append(["group", "in", names])
+        if gids:
+            filters.append(["gid", "in", gids])
+
+        if not filters:
+            return {}
+        elif len(filters) == 1:
+            filter = filters
         else:
-            filter = [["gid", "=", key]]
+            filter = [["OR", filters]]
 
-        return c.call(
-            "group.query",
-            filter,
-            {"get": True},
-        )["id"]
+        result = {}
+        for group in c.call("group.query", filter, {"select": ["id", "group", "gid"]}):
+            # Same as `{"get": True}`: the first matching group wins
+            result.setdefault(group["group"], group["id"])
+            result.setdefault(group["gid"], group["id"])
+
+        return result
 
     def _create_argument(self, item):
         if item["_name_"] == "group":
@@ -110,20 +158,20 @@ class AccountCommandMixin:
 
 class AccountCreateCommand(AccountCommandMixin, GenericCallCommand):
     def _process_method(self, method):
-        method["accepts"][0]["properties"]["group"]["type"] = ["integer", "string"]
-        return method
+        return set_path(method, ["accepts", 0, "properties", "group", "type"], ["integer", "string"])
 
     def _process_call_args(self, values):
+        values = list(values)
         if values:
-            self._process_value(values[0])
+            values[0] = self._process_value(values[0])
         return values
 
 
 class AccountUpdateCommand(AccountCommandMixin, UpdateCommand):
     def _process_method(self, method):
-        method["accepts"][0]["_name_"] = "uid_or_username"
-        method["accepts"][0]["type"] = ["integer", "string"]
-        method["accepts"][1]["properties"]["group"]["type"] = ["integer", "string"]
+        method = set_path(method, ["accepts", 0, "_name_"], "uid_or_username")
+        method = set_path(method, ["accepts", 0, "type"], ["integer", "string"])
+        method = set_path(method, ["accepts", 1, "properties", "group", "type"], ["integer", "string"])
         return method
 
     def _process_call_args(self, values):
@@ -131,7 +179,7 @@ class AccountUpdateCommand(AccountCommandMixin, UpdateCommand):
         if values:
             values[0] = self._process_key(values[0])
             if len(values) > 1:
-                self._process_value(values[1])
+                values[1] = self._process_value(values[1])
         return values
 
     def _get_instance_call_arg(self, pk):
@@ -140,8 +188,7 @@ class AccountUpdateCommand(AccountCommandMixin, UpdateCommand):
 
 class AccountItemMethodCommand(AccountCommandMixin, GenericCallCommand):
     def _process_method(self, method):
-        method["accepts"][0]["type"] = ["integer", "string"]
-        return method
+        return set_path(method, ["accepts", 0, "type"], ["integer", "string"])
 
     def _process_call_args(self, values):
         values = list(values)
@@ -150,29 +197,33 @@ class AccountItemMethodCommand(AccountCommandMixin, GenericCallCommand):
         return values
 
 
-@rows_processor
+@rows_processor(requires=[], produces=["group"])
 def patch_groups(context, groups):
-    with context.get_client() as c:
-        users = {
-            user["id"]: user["username"]
-            for user in c.call("user.query", [], {"select": ["id", "username"]})
-        }
-
     for i, group in enumerate(groups):
-        groups[i] = group = {
+        groups[i] = {
             k: group[k]
             for k in ["gid", "name"] + [k for k in group.keys() if k not in ["gid", "group", "name"]]
             if k in group
         }
 
-        group["users"] = [users[id] for id in group["users"]]
+
+@rows_processor(requires=["users"], produces=["users"])
+def patch_groups_users(context, groups):
+    users = lookup_table(context, "user", "id", "username", {id for group in groups for id in group.get("users", [])})
+
+    for group in groups:
+        if "users" in group:
+            group["users"] = [users[id] for id in group["users"]]
 
 
 class GroupQueryCommand(QueryCommand):
-    output_processors = [remove_id, patch_groups]
+    output_processors = [remove_id, patch_groups, patch_groups_users]
 
 
 class GroupCommandMixin:
+    # Group members are specified when creating or updating a group
+    invalidated_services = ["user"]
+
     def _process_key(self, key):
         with self.context.get_client() as c:
             if isinstance(key, str):
@@ -194,17 +245,26 @@ class GroupCommandMixin:
                 )])
 
     def _process_value(self, value):
+        """
+        Returns a copy of `value` with usernames and uids replaced with user ids.
+        """
+        if "users" not in value:
+            return value
+
+        value = value.copy()
+        value["users"] = list(value["users"])
         with self.context.get_client() as c:
-            if "users" in value:
-                for i, user in enumerate(value["users"]):
-                    try:
-                        value["users"][i] = self._get_user(c, user)
-                    except ClientException:
-                        raise ValidationErrors([(
-                            f'{self.method["accepts"][0]["_name_"]}.users.{i}',
-                            f"User {user!r} does not exist",
-                            errno.ENOENT,
-                        )])
+            for i, user in enumerate(value["users"]):
+                try:
+                    value["users"][i] = self._get_user(c, user)
+                except ClientException:
+                    raise ValidationErrors([(
+                        f'{self.method["accepts"][0]["_name_"]}.users.{i}',
+                        f"User {user!r} does not exist",
+                        errno.ENOENT,
+                    )])
+
+        return value
 
     def _get_user(self, c, key):
         if isinstance(key, str):
@@ -221,15 +281,16 @@ class GroupCommandMixin:
 
 class GroupCreateCommand(GroupCommandMixin, GenericCallCommand):
     def _process_call_args(self, values):
+        values = list(values)
         if values:
-            self._process_value(values[0])
+            values[0] = self._process_value(values[0])
         return values
 
 
 class GroupUpdateCommand(GroupCommandMixin, UpdateCommand):
     def _process_method(self, method):
-        method["accepts"][0]["_name_"] = "gid_or_name"
-        method["accepts"][0]["type"] = ["integer", "string"]
+        method = set_path(method, ["accepts", 0, "_name_"], "gid_or_name")
+        method = set_path(method, ["accepts", 0, "type"], ["integer", "string"])
         return method
 
     def _process_call_args(self, values):
@@ -237,7 +298,7 @@ class GroupUpdateCommand(GroupCommandMixin, UpdateCommand):
         if values:
             values[0] = self._process_key(values[0])
             if len(values) > 1:
-                self._process_value(values[1])
+                values[1] = self._process_value(values[1])
         return values
 
     def _get_instance_call_arg(self, pk):
@@ -246,8 +307,7 @@ class GroupUpdateCommand(GroupCommandMixin, UpdateCommand):
 
 class GroupItemMethodCommand(GroupCommandMixin, GenericCallCommand):
     def _process_method(self, method):
-        method["accepts"][0]["type"] = ["integer", "string"]
-        return method
+        return set_path(method, ["accepts", 0, "type"], ["integer", "string"])
 
     def _process_call_args(self, values):
         values = list(values)
@@ -258,8 +318,7 @@ class GroupItemMethodCommand(GroupCommandMixin, GenericCallCommand):
 
 class ShellChoicesCommand(GroupCommandMixin, GenericCallCommand):
     def _process_method(self, method):
-        method["accepts"][0]["items"] = [{"type": "integer"}, {"type": "string"}]
-        return method
+        return set_path(method, ["accepts", 0, "items"], [{"type": "integer"}, {"type": "string"}])
 
     def _process_call_args(self, values):
         values = list(values)
@@ -17,25 +17,26 @@ __all__ = ["InterfaceQueryCommand", "InterfaceCreateCommand", "InterfaceUpdateCo
 remove_id = remove_fields("id")
 
 
-@rows_processor
+@rows_processor(requires=["state", "aliases"], produces=["state.aliases", "state", "aliases", "fake"])
 def patch_interface(context, interfaces):
     for i, interface in enumerate(interfaces):
-        interface["state.aliases"] = [
-            alias_to_str(alias)
-            for alias in interface["state"]["aliases"]
-            if alias["type"] in ["INET", "INET6"]
-        ]
-        interface["aliases"] = [
-            alias_to_str(alias)
-            for alias in interface["aliases"]
-        ]
-
-        interface.pop("fake")
-        interface.pop("state")
+        if "state" in interface:
+            interface["state.aliases"] = [
+                alias_to_str(alias)
+                for alias in interface["state"]["aliases"]
+                if alias["type"] in ["INET", "INET6"]
+            ]
+        if "aliases" in interface:
+            interface["aliases"] = [
+                alias_to_str(alias)
+                for alias in interface["aliases"]
+            ]
+
+        interface.pop("fake", None)
+        interface.pop("state", None)
 
         interfaces[i] = {
-            "name": interface["name"],
-            "type": interface["type"],
+            **{k: interface[k] for k in ["name", "type"] if k in interface},
             **{k: v for k, v in interface.items() if k.startswith("state.")},
             **{k: v for k, v in interface.items() if not (k in ["name", "type"] or k.startswith("state."))},
         }
@@ -54,7 +55,7 @@ class InterfaceCommandMixin:
                     except Exception as e:
                         errors.append((f"{schema}.aliases.{i}", str(e), errno.EINVAL))
 
-                interface["aliases"] = aliases
+                interface = {**interface, "aliases": aliases}
 
         if errors:
             raise ValidationErrors(errors)
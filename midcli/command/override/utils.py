@@ -4,10 +4,21 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["rows_processor", "remove_fields"]
+__all__ = ["rows_processor", "remove_fields", "lookup_table"]
 
 
-def rows_processor(f):
+def rows_processor(f=None, *, requires=None, produces=None):
+    """
+    Makes an output processor that processes the query result rows in-place.
+
+    `requires` are the fields the processor reads from the rows and `produces` are the columns it creates, changes or
+    removes (`None` means "any"). `QueryCommand` uses them to skip the processors that do not produce any of the
+    selected columns and to only request the fields the remaining processors require from the server. Such processors
+    must handle rows that lack any of the `requires` fields.
+    """
+    if f is None:
+        return functools.partial(rows_processor, requires=requires, produces=produces)
+
     @functools.wraps(f)
     def process_rows(context, result):
         if isinstance(result, dict):
@@ -19,6 +30,8 @@ def rows_processor(f):
 
         return result
 
+    process_rows.requires = requires
+    process_rows.produces = produces
     return process_rows
 
 
@@ -26,10 +39,30 @@ def remove_fields(fields):
     if isinstance(fields, str):
         fields = [fields]
 
-    return rows_processor(functools.partial(_remove_fields, fields))
+    return rows_processor(functools.partial(_remove_fields, fields), requires=[], produces=fields)
 
 
 def _remove_fields(fields, context, result):
     for row in result:
         for field in fields:
             row.pop(field, None)
+
+
+def lookup_table(context, service, key, value, keys=()):
+    """
+    Returns `{row[key]: row[value]}` for all the rows of the `service` (i.e. group id -> group name).
+
+    The table is cached in `context.call_cache` so it is shared by all the output processors and is invalidated
+    when the CLI modifies the `service`. It is also re-fetched if it does not contain some of the `keys` (i.e. the
+    rows were created by another client).
+    """
+    def query():
+        with context.get_client() as c:
+            return {row[key]: row[value] for row in c.call(f"{service}.query", [], {"select": [key, value]})}
+
+    table = context.call_cache.get(service, ("lookup", key, value), query)
+    if not set(keys) <= table.keys():
+        context.call_cache.invalidate(service)
+        table = context.call_cache.get(service, ("lookup", key, value), query)
+
+    return table
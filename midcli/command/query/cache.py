@@ -0,0 +1,12 @@
+# -*- coding=utf-8 -*-
+import logging
+
+from midcli.utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["query_cache"]
+
+# Parsed query texts and WHERE clauses, shared between query execution and completion (that re-parses the whole query
+# on every keystroke). Only successful parse results are cached, the values must not be modified.
+query_cache = LRUCache(maxsize=512)
@@ -4,6 +4,7 @@ import logging
 
 from midcli.command.call_mixin import CallMixin
 from midcli.command.interface import Command, ProcessInputError
+from midcli.pager import echo_via_pager
 
 from .completions import get_completions
 from .parse import ParseError, parse
@@ -16,7 +17,18 @@ __all__ = ["QueryCommand"]
 def output_processor(select, rv):
     if select is not None:
         if isinstance(rv, dict):
-            return {k: v for k, v in rv.items() if k in select}
+            if rv.keys() <= set(select):
+                # Server has already honoured the selection
+                return rv
+
+            result = {}
+            for column in select:
+                try:
+                    result[column] = select_column(rv, column)
+                except KeyError:
+                    pass
+
+            return result
 
         if isinstance(rv, list):
             return [output_processor(select, item) for item in rv]
@@ -24,6 +36,41 @@ def output_processor(select, rv):
     return rv
 
 
+def select_column(row, column):
+    """
+    Returns `column` value from the `row`. `column` may be a dotted path to a nested value (the value is looked up
+    as-is first as output processors may produce such columns).
+    """
+    if column in row:
+        return row[column]
+
+    value = row
+    for key in column.split("."):
+        if not isinstance(value, dict):
+            raise KeyError(column)
+
+        value = value[key]
+
+    return value
+
+
+def validate_column(schema, column):
+    """
+    Checks that (possibly dotted) `column` exists in the `schema`. Nested objects that allow additional properties
+    (or schemas that do not describe their properties at all) accept any nested path.
+    """
+    for key in column.split("."):
+        if "properties" not in schema:
+            return True
+
+        if key not in schema["properties"]:
+            return bool(schema.get("additionalProperties", False))
+
+        schema = schema["properties"][key]
+
+    return True
+
+
 class QueryCommand(CallMixin, Command):
     def __init__(self, *args, method=None, **kwargs):
         self.method = method
@@ -36,9 +83,90 @@ class QueryCommand(CallMixin, Command):
             raise ProcessInputError(e.args[0])
 
         select = parsed.options.pop("select", None)
+        output_processors = self._get_output_processors(select)
+        if select is not None and (server_select := self._get_server_select(select, output_processors)):
+            if schema := self.method.get("filterable_schema"):
+                for column in server_select:
+                    if column in select and not validate_column(schema, column):
+                        raise ProcessInputError(f"Unknown column: {column!r}")
+
+            parsed.options["select"] = server_select
+
+        if (
+            self.context.page_size and
+            not parsed.options.keys() & {"count", "get", "limit", "offset"} and
+            # Output processors can add fields to some rows only, the table header must be built from all the rows
+            not output_processors
+        ):
+            pages = self._query_pages(parsed.filters, parsed.options, functools.partial(output_processor, select),
+                                      output_processors)
+            if self.output:
+                echo_via_pager(self.context.display_mode_manager.mode.display_pages(pages))
+            else:
+                for _ in pages:
+                    pass
+
+            return
 
         self.call(self.method["name"], parsed.filters, parsed.options,
-                  output_processor=functools.partial(output_processor, select))
+                  output_processor=functools.partial(output_processor, select), output_processors=output_processors)
+
+    def _get_output_processors(self, select):
+        """
+        Skips the output processors that do not produce any of the selected columns.
+        """
+        if select is None:
+            return self.output_processors
+
+        selected = {column.split(".")[0] for column in select}
+        return [
+            op for op in self.output_processors
+            if getattr(op, "produces", None) is None or selected & {column.split(".")[0] for column in op.produces}
+        ]
+
+    def _get_server_select(self, select, output_processors):
+        """
+        Returns the fields that must be requested from the server to display the selected columns (the selected
+        columns that are not produced by the output processors and the fields that the output processors require) or
+        `None` if all the fields must be requested.
+        """
+        produced = set()
+        required = []
+        for op in output_processors:
+            requires = getattr(op, "requires", None)
+            produces = getattr(op, "produces", None)
+            if requires is None or produces is None:
+                return None
+
+            produced |= {column.split(".")[0] for column in produces}
+            required.extend(requires)
+
+        server_select = list(dict.fromkeys(
+            [column for column in select if column.split(".")[0] not in produced] + required
+        ))
+        if not server_select:
+            return None
+
+        return server_select
+
+    def _query_pages(self, filters, options, output_processor, output_processors=None):
+        """
+        Yields the query results in pages of `context.page_size` rows. The next page is only requested when the
+        previous one was consumed, so a display mode that stops iterating (i.e. the user closed the pager) prevents
+        the remaining rows from being fetched.
+        """
+        page_size = self.context.page_size
+        offset = 0
+        while True:
+            page = self._call(self.method["name"], filters, {**options, "limit": page_size, "offset": offset},
+                              output_processor=output_processor, output_processors=output_processors)
+            if page:
+                yield page
+
+            if len(page) < page_size:
+                break
+
+            offset += page_size
 
     def get_completions(self, text):
         return get_completions(self.method["filterable_schema"], text)
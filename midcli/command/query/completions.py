@@ -1,11 +1,13 @@
 # -*- coding=utf-8 -*-
+from keyword import iskeyword
 import logging
 import re
 
 from prompt_toolkit.completion import Completion
 import pyparsing
 
-from .grammar import parse_query_command
+from .parse import ParseError, parse_filters
+from .grammar import CLAUSE_KEYWORDS, ORDER_DIRECTIONS, parse_query_command
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,29 @@ def get_completions_for_prefix(options, prefix, exclude=None):
     ]
 
 
+def get_keyword_completions(keywords, text, prefix=""):
+    """
+    Completes one of the `keywords` (typed in any case) after `prefix`. Inserts a space before the keyword if the
+    user has not typed it yet.
+    """
+    return [
+        Completion(keyword if not text or text[-1].isspace() or prefix else f" {keyword}", -len(prefix))
+        for keyword in keywords
+        if keyword.startswith(prefix.upper())
+    ]
+
+
+def get_next_keywords(parsed):
+    """
+    Clause keywords that can follow the already parsed clauses.
+    """
+    for keyword, key in reversed(list(zip(CLAUSE_KEYWORDS, ["where_clause", "order_by", "limit", "offset"]))):
+        if key in parsed:
+            return CLAUSE_KEYWORDS[CLAUSE_KEYWORDS.index(keyword) + 1:]
+
+    return CLAUSE_KEYWORDS
+
+
 def get_completions(schema, text):
     if not schema:
         return []
@@ -36,6 +61,56 @@ def get_completions(schema, text):
     except pyparsing.ParseException:
         return []
 
+    if "rest" in parsed:
+        rest = parsed["rest"]
+        if rest.strip() == ",":
+            # Delimited list parser does not consume the trailing comma
+            if "order_by" in parsed:
+                columns = [item["column"] for item in parsed["order_by"]]
+            else:
+                columns = parsed.get("columns", [])
+
+            return get_completions_for_prefix(schema["_attrs_order_"], "", list(columns))
+
+        if re.fullmatch(r"ORDER\s+BY\s+", rest, flags=re.IGNORECASE):
+            return get_completions_for_prefix(schema["_attrs_order_"], "")
+
+        # Partially typed keyword
+        if re.fullmatch(r"[a-z]+", rest, flags=re.IGNORECASE):
+            keywords = get_next_keywords(parsed)
+            if "order_by" in parsed and "direction" not in parsed["order_by"][-1]:
+                keywords = ORDER_DIRECTIONS + keywords
+
+            return get_keyword_completions(keywords, text, rest)
+
+        return []
+
+    if "offset" in parsed:
+        return []
+
+    if "limit" in parsed:
+        if text[-1].isspace():
+            return get_keyword_completions(get_next_keywords(parsed), text)
+
+        return []
+
+    if "order_by" in parsed:
+        columns = [item["column"] for item in parsed["order_by"]]
+
+        if text[-1].isspace():
+            return get_keyword_completions(
+                (ORDER_DIRECTIONS if "direction" not in parsed["order_by"][-1] else []) + get_next_keywords(parsed),
+                text,
+            )
+
+        if "direction" in parsed["order_by"][-1]:
+            return []
+
+        return get_completions_for_prefix(
+            [field for field in schema["_attrs_order_"] if field not in columns],
+            columns[-1],
+        )
+
     if "where_clause" in parsed:
         where_clause = parsed["where_clause"]
         if not where_clause:
@@ -48,25 +123,42 @@ def get_completions(schema, text):
                            flags=re.IGNORECASE):
             prefix = m.group("prefix")
 
+        completions = []
         if prefix is not None:
-            return get_completions_for_prefix(schema["_attrs_order_"], prefix)
-        else:
-            return []
-    elif "all_columns" in parsed:
-        if text[-1].isspace():
-            return [Completion("WHERE", 0)]
-        else:
-            return [Completion(" WHERE", 0)]
-    else:
+            completions.extend(get_completions_for_prefix(schema["_attrs_order_"], prefix))
+
+        # Next clause keyword can follow a complete filter expression (but not a typed operator like `or`, that
+        # continues it)
+        m = re.match(r"(?P<expression>.*?)(?P<prefix>[a-z]*)$", where_clause, flags=re.IGNORECASE | re.DOTALL)
+        if (
+            (m.group("prefix") or where_clause[-1].isspace()) and
+            not iskeyword(m.group("prefix")) and
+            m.group("expression").strip() and
+            m.group("expression")[-1].isspace() and
+            is_complete_filter(m.group("expression"))
+        ):
+            completions.extend(get_keyword_completions(get_next_keywords(parsed), text, m.group("prefix")))
+
+        return completions
+
+    if "columns" in parsed and not text[-1].isspace():
         columns = parsed["columns"].asList()
 
-        if text_stripped[-1] == ",":
-            return get_completions_for_prefix(schema["_attrs_order_"], "", columns)
-        else:
-            if text[-1].isspace():
-                return [Completion("WHERE", 0)]
+        return get_completions_for_prefix(
+            [field for field in schema["_attrs_order_"] if field not in columns],
+            columns[-1],
+        )
 
-            return get_completions_for_prefix(
-                [field for field in schema["_attrs_order_"] if field not in columns],
-                columns[-1],
-            )
+    if "count" in parsed or "all_columns" in parsed or text[-1].isspace():
+        return get_keyword_completions(CLAUSE_KEYWORDS, text)
+
+    return []
+
+
+def is_complete_filter(text):
+    try:
+        parse_filters(text.strip())
+    except ParseError:
+        return False
+
+    return True
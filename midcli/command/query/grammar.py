@@ -1,21 +1,71 @@
 # -*- coding=utf-8 -*-
+import functools
 import logging
 
 import pyparsing as pp
 
+from .cache import query_cache
+
 logger = logging.getLogger(__name__)
 
-__all__ = ["parse_query_command"]
+__all__ = ["parse_query_command", "CLAUSE_KEYWORDS", "ORDER_DIRECTIONS"]
+
+CLAUSE_KEYWORDS = ["WHERE", "ORDER BY", "LIMIT", "OFFSET"]
+ORDER_DIRECTIONS = ["ASC", "DESC"]
 
 column = pp.Word(pp.alphas, pp.alphanums + "_.").setName("column")
 all_columns = pp.Literal("*")
-select_expression = pp.delimitedList(column).setResultsName("columns") | all_columns.setResultsName("all_columns")
+count_expression = (
+    pp.CaselessKeyword("COUNT") + pp.Literal("(") + pp.Literal("*") + pp.Literal(")")
+).setName("COUNT(*)")
+select_expression = (
+    count_expression.setResultsName("count") |
+    pp.delimitedList(column).setResultsName("columns") |
+    all_columns.setResultsName("all_columns")
+)
+
+integer = pp.Word(pp.nums).setName("integer").setParseAction(lambda t: int(t[0]))
+
+order_by_keyword = pp.CaselessKeyword("ORDER") + pp.CaselessKeyword("BY")
+order_direction = pp.CaselessKeyword("ASC") | pp.CaselessKeyword("DESC")
+order_by_item = pp.Group(column.setResultsName("column") + pp.Optional(order_direction.setResultsName("direction")))
+order_by_clause = order_by_keyword + pp.delimitedList(order_by_item).setResultsName("order_by")
+
+limit_keyword = pp.CaselessKeyword("LIMIT")
+limit_clause = limit_keyword + integer.setResultsName("limit")
 
-where_keyword = pp.Keyword("WHERE", caseless=True)
-where_clause = where_keyword + pp.CharsNotIn("").setResultsName("where_clause")
+offset_keyword = pp.CaselessKeyword("OFFSET")
+offset_clause = offset_keyword + integer.setResultsName("offset")
 
-command = select_expression + pp.Optional(where_clause)
+where_keyword = pp.CaselessKeyword("WHERE")
+# WHERE clause is a python expression that is parsed separately. It lasts until the next clause keyword (that is not a
+# part of a string literal) followed by its argument (or the end of the text so that a partially typed clause can be
+# completed), so columns named like a keyword (i.e. `limit == 5`) can be used in the expression.
+where_clause = where_keyword + pp.SkipTo(
+    order_by_keyword + (column | pp.StringEnd()) |
+    limit_keyword + (integer | pp.StringEnd()) |
+    offset_keyword + (integer | pp.StringEnd()) |
+    pp.StringEnd().leaveWhitespace(),
+    ignore=pp.quotedString,
+).leaveWhitespace(recursive=False).setResultsName("where_clause")
+
+command = (
+    select_expression +
+    pp.Optional(where_clause) +
+    pp.Optional(order_by_clause) +
+    pp.Optional(limit_clause) +
+    pp.Optional(offset_clause)
+)
+# Used for completions, `rest` is the text that could not be parsed (e.g. partially typed keyword)
+partial_command = command + pp.Optional(pp.Regex(".+").setResultsName("rest"))
 
 
 def parse_query_command(text, parseAll=True):
-    return dict(command.parseString(text, parseAll=parseAll).items())
+    return query_cache.get(("grammar", parseAll, text), functools.partial(_parse_query_command, text, parseAll))
+
+
+def _parse_query_command(text, parseAll):
+    if parseAll:
+        return dict(command.parseString(text, parseAll=True).items())
+
+    return dict(partial_command.parseString(text).items())
@@ -1,12 +1,15 @@
 # -*- coding=utf-8 -*-
 import ast
 from collections import namedtuple
+import copy
+import functools
 import logging
 
 import pyparsing
 
 from midcli.utils.pyparsing.exception import format_pyparsing_exception
 
+from .cache import query_cache
 from .grammar import parse_query_command
 
 logger = logging.getLogger(__name__)
@@ -21,6 +24,11 @@ class ParseError(Exception):
 
 
 def parse(text):
+    # Callers are free to modify the result
+    return copy.deepcopy(query_cache.get(("parse", text), functools.partial(_parse, text)))
+
+
+def _parse(text):
     filters = []
     options = {}
 
@@ -33,13 +41,29 @@ def parse(text):
         if "where_clause" in parsed and parsed["where_clause"].strip():
             filters = [parse_filters(parsed["where_clause"].strip())]
 
-        if "all_columns" not in parsed:
+        if "count" in parsed:
+            options["count"] = True
+        elif "all_columns" not in parsed:
             options["select"] = parsed["columns"].asList()
 
+        if "order_by" in parsed:
+            options["order_by"] = [
+                ("-" if item.get("direction", "").upper() == "DESC" else "") + item["column"]
+                for item in parsed["order_by"]
+            ]
+
+        for option in ["limit", "offset"]:
+            if option in parsed:
+                options[option] = parsed[option]
+
     return ParsedQueryCommand(filters, options)
 
 
 def parse_filters(text):
+    return query_cache.get(("filters", text), functools.partial(_parse_filters, text))
+
+
+def _parse_filters(text):
     try:
         expression = ast.parse(text, mode="eval")
     except SyntaxError as e:
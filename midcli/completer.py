@@ -1,4 +1,13 @@
+import asyncio
+import logging
+import threading
+import time
+
+from prompt_toolkit.application.current import get_app
 from prompt_toolkit.completion import Completer
+from prompt_toolkit.eventloop import run_in_executor_with_context
+
+logger = logging.getLogger(__name__)
 
 
 class MidCompleter(Completer):
@@ -10,3 +19,86 @@ class MidCompleter(Completer):
     def get_completions(self, document, complete_event):
         for i in self.context.get_completions(document.text):
             yield i
+
+
+class DebouncedCompleter(Completer):
+    """
+    Runs `completer` in a background thread (like `ThreadedCompleter`), but:
+
+    * waits for `delay` seconds before starting so that a burst of keystrokes only produces one completion request
+    * abandons the request as soon as the buffer text changes (so that the completion for the new text can start
+      immediately) and tells the background thread to stop producing completions
+    * abandons the request if it takes more than `timeout` seconds
+
+    `metrics` counts requested, delivered, cancelled (outdated) and timed out completions.
+    """
+
+    poll_interval = 0.05
+
+    def __init__(self, completer, delay=0.1, timeout=3, get_document=None):
+        self.completer = completer
+        self.delay = delay
+        self.timeout = timeout
+        self.get_document = get_document or (lambda: get_app().current_buffer.document)
+
+        self.metrics = {"requested": 0, "delivered": 0, "cancelled": 0, "timed_out": 0}
+
+    def get_completions(self, document, complete_event):
+        return self.completer.get_completions(document, complete_event)
+
+    async def get_completions_async(self, document, complete_event):
+        self.metrics["requested"] += 1
+
+        await asyncio.sleep(self.delay)
+        if self._is_outdated(document):
+            self._count("cancelled")
+            return
+
+        stop = threading.Event()
+        deadline = time.monotonic() + self.timeout
+
+        def collect():
+            completions = []
+            for completion in self.completer.get_completions(document, complete_event):
+                if stop.is_set() or time.monotonic() > deadline:
+                    break
+
+                completions.append(completion)
+
+            return completions
+
+        future = run_in_executor_with_context(collect)
+        try:
+            while True:
+                done, _ = await asyncio.wait({future}, timeout=self.poll_interval)
+                if done:
+                    break
+
+                if self._is_outdated(document):
+                    self._count("cancelled")
+                    return
+
+                if time.monotonic() > deadline:
+                    self._count("timed_out")
+                    return
+        finally:
+            stop.set()
+
+        if self._is_outdated(document):
+            self._count("cancelled")
+            return
+
+        completions = future.result()
+        self._count("delivered")
+        for completion in completions:
+            yield completion
+
+    def _is_outdated(self, document):
+        return self.get_document().text != document.text
+
+    def _count(self, metric):
+        self.metrics[metric] += 1
+        logger.debug("Completion %s, metrics: %r", metric, self.metrics)
+
+    def __repr__(self):
+        return f"DebouncedCompleter({self.completer!r})"
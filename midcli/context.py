@@ -1,5 +1,7 @@
+import functools
 import re
 import socket
+import threading
 import time
 
 from prompt_toolkit import print_formatted_text as print
@@ -7,9 +9,11 @@ from prompt_toolkit.completion import Completion
 
 from truenas_api_client import Client, ClientException
 
+from .call_cache import CallCache
+from .client_pool import ClientPool
 from .command.generic_call import GenericCallCommand
 from .command.generic_call.update import UpdateCommand
-from .command.interface import Command
+from .command.interface import Command, ProcessInputError
 from .command.override.account import *
 from .command.override.api_key import *
 from .command.override.interface import *
@@ -20,8 +24,30 @@ from .command.ui.display_mode import ModeCommand
 from .command.ui.stacks import StacksCommand
 from .display_mode.manager import DisplayModeManager
 from .display_mode.mode.csv import CsvDisplayMode
+from .display_mode.mode.json import JsonDisplayMode
+from .display_mode.mode.ndjson import NdjsonDisplayMode
 from .display_mode.mode.table import TableDisplayMode
+from .interface_status import InterfaceStatusMonitor
+from .schema_cache import SchemaCache
 from .utils.shell import is_main_cli, spawn_shell
+from .utils.trie import PrefixTrie
+
+
+class LazyCommand:
+    """
+    Placeholder that stands for a command in `Namespace.children` until the command is accessed for the first time.
+    """
+
+    builtin = False
+
+    def __init__(self, name, description, factory):
+        self.name = name
+        self.aliases = []
+        self.description = description
+        self.factory = factory
+
+    def __repr__(self):
+        return f"LazyCommand<{self.name}>"
 
 
 class Namespace:
@@ -32,7 +58,7 @@ class Namespace:
         self.name = name
         self.aliases = []
         self.description = description
-        self.children = list(filter(None, [
+        self._children = list(filter(None, [
             BackCommand(context, self),
             ExitCommand(context, self),
             LsCommand(context, self),
@@ -44,6 +70,14 @@ class Namespace:
             ModeCommand(context, self),
             StacksCommand(context, self),
         ]))
+        # name or alias -> index of the first child with that name in `self._children`
+        self._index = {}
+        # names of non-builtin children (the ones that are offered for completion) -> indexes in `self._children`
+        self._completions = PrefixTrie()
+        for index, child in enumerate(self._children):
+            self._index_child(index, child)
+        self._lazy_children = 0
+        self._lock = threading.Lock()
 
     def __repr__(self):
         return f"Namespace<{self.name}>"
@@ -51,20 +85,38 @@ class Namespace:
     def __lt__(self, other):
         return self.name < other.name
 
+    @property
+    def children(self):
+        if self._lazy_children:
+            for i in range(len(self._children)):
+                self._child(i)
+
+        return self._children
+
     def add_child(self, namespace):
         assert isinstance(namespace, (Command, Namespace))
-        self.children.append(namespace)
+        self._children.append(namespace)
+        self._index_child(len(self._children) - 1, namespace)
         namespace.parent = self
 
+    def add_lazy_child(self, name, description, factory):
+        """
+        Adds a command that will only be constructed (by calling `factory`) when it is accessed for the first time.
+        """
+        self._children.append(LazyCommand(name, description, factory))
+        self._index_child(len(self._children) - 1, self._children[-1])
+        self._lazy_children += 1
+
     def find(self, path):
         cur = path[0]
         path = path[1:]
-        for i in self.children:
-            if cur in [i.name] + i.aliases:
-                if path:
-                    return i.find(path)
-                return i
-        return None
+        if (index := self._index.get(cur)) is None:
+            return None
+
+        i = self._child(index)
+        if path:
+            return i.find(path)
+        return i
 
     def process_input(self, text):
         if not text.strip():
@@ -72,34 +124,52 @@ class Namespace:
 
         name, rest = self._shift(text)
 
-        for i in self.children:
-            if name in [i.name] + i.aliases:
-                if isinstance(i, Namespace):
-                    if rest:
-                        return i.process_input(rest)
-                    return i
-                elif isinstance(i, Command):
-                    i.process_input(rest)
-                    return
+        if (index := self._index.get(name)) is not None:
+            i = self._child(index)
+            if isinstance(i, Namespace):
+                if rest:
+                    return i.process_input(rest)
+                return i
+            elif isinstance(i, Command):
+                i.process_input(rest)
+                return
 
-        print(f"Namespace {name} not found")
+        raise ProcessInputError(f"Namespace {name} not found")
 
     def get_completions(self, text):
         name, rest = self._shift(text)
 
-        for i in self.children:
-            if isinstance(i, Command) and i.builtin:
-                continue
-            if i.name.startswith(name):
-                if rest is not None:
-                    if i.name == name:
-                        for c in i.get_completions(rest):
-                            yield c
-                else:
-                    yield Completion(i.name, - len(name))
+        if rest is not None:
+            for index in self._completions.get(name):
+                for c in self._child(index).get_completions(rest):
+                    yield c
+        else:
+            for index in sorted(self._completions.get_prefix(name)):
+                yield Completion(self._children[index].name, - len(name))
 
         return []
 
+    def _index_child(self, index, child):
+        for name in [child.name] + child.aliases:
+            self._index.setdefault(name, index)
+
+        if not (isinstance(child, Command) and child.builtin):
+            self._completions.add(child.name, index)
+
+    def _child(self, index):
+        child = self._children[index]
+        if isinstance(child, LazyCommand):
+            with self._lock:
+                # Another thread (i.e. completer) might have already constructed it
+                child = self._children[index]
+                if isinstance(child, LazyCommand):
+                    child = child.factory()
+                    child.parent = self
+                    self._children[index] = child
+                    self._lazy_children -= 1
+
+        return child
+
     def _shift(self, text):
         parsed = re.split(r"\s+", text.lstrip(), maxsplit=1)
 
@@ -178,33 +248,38 @@ class Namespaces:
                 if command == GenericCallCommand:
                     command = UpdateCommand
 
-            command = command(self.context, namespace, name, method['cli_description'], method['description'],
-                              method['examples'].get('cli'), method=method, **kwargs)
-
-            namespace.add_child(command)
+            namespace.add_lazy_child(name, method['cli_description'], functools.partial(
+                command, self.context, namespace, name, method['cli_description'], method['description'],
+                method['examples'].get('cli'), method=method, **kwargs,
+            ))
 
 
 class Context:
-    def __init__(self, cli, url, user, password, timeout, editor, menu, menu_item, mode, stacks):
+    def __init__(self, cli, url, user, password, timeout, editor, menu, menu_item, mode, stacks, page_size=None):
         self.cli = cli
         self.url = url
         self.user = user
         self.password = password
         self.timeout = timeout
+        self.page_size = page_size
+        self.client_pool = ClientPool(self._connect)
+        self.call_cache = CallCache()
+        self.interface_status = InterfaceStatusMonitor(self._create_client)
+        self.schema_cache = SchemaCache(url, user)
         self.reload()
         with self.get_client() as c:
-            self.methods = c.call('core.get_methods', None, 'CLI')
-            self.services = c.call('core.get_services', 'CLI')
-            self.namespaces = Namespaces(self, c)
-        self._current_namespace = self.namespaces.root
+            self.load_schema(c)
         self.display_mode_manager = DisplayModeManager({
             "csv": CsvDisplayMode,
+            "json": JsonDisplayMode,
+            "ndjson": NdjsonDisplayMode,
             "table": TableDisplayMode,
         }, mode or "table")
         self.stacks = stacks
         self.editor = editor
         self.menu = menu
         self.menu_item = menu_item
+        self.show_banners = True
 
     @property
     def current_namespace(self):
@@ -213,7 +288,8 @@ class Context:
     @current_namespace.setter
     def current_namespace(self, namespace):
         self._current_namespace = namespace
-        self.show_banner()
+        if self.show_banners:
+            self.show_banner()
 
     def show_banner(self):
         if self._current_namespace == self.namespaces.root:
@@ -247,17 +323,48 @@ class Context:
         with self.get_client() as c:
             self.hostname = c.call('system.hostname')
 
+    def load_schema(self, c, version=None):
+        """
+        (Re)loads the methods schema of the middleware `version` (queried if not specified) and builds the namespaces
+        tree for it.
+        """
+        if version is None:
+            version = c.call('system.version')
+
+        self.version = version
+        self.methods, self.services = self._get_schema(c, version)
+        self.namespaces = Namespaces(self, c)
+        self._current_namespace = self.namespaces.root
+
+    def _get_schema(self, c, version):
+        if (schema := self.schema_cache.load(version)) is not None:
+            return schema
+
+        methods = c.call('core.get_methods', None, 'CLI')
+        services = c.call('core.get_services', 'CLI')
+        self.schema_cache.save(version, methods, services)
+        return methods, services
+
     def get_client(self):
+        return self.client_pool.client()
+
+    def _create_client(self):
+        c = Client(self.url, private_methods=True, call_timeout=self.timeout)
+        try:
+            if self.user and self.password:
+                if not c.call('auth.login', self.user, self.password):
+                    raise Exception("Invalid username or password")
+        except Exception:
+            c.close()
+            raise
+
+        return c
+
+    def _connect(self):
         recoverable_errors = 0
         while True:
             try:
-                c = Client(self.url, private_methods=True, call_timeout=self.timeout)
-
-                if self.user and self.password:
-                    if not c.call('auth.login', self.user, self.password):
-                        raise Exception("Invalid username or password")
-
-                return c
+                return self._create_client()
             except Exception as e:
                 recoverable_error = False
                 if isinstance(e, (FileNotFoundError, ConnectionRefusedError)):
@@ -0,0 +1,72 @@
+# -*- coding=utf-8 -*-
+# Thin client for the resident CLI server (see `midcli.daemon.server`). It is meant to start as fast as possible, so it
+# must only import the standard library unless it falls back to in-process execution.
+import json
+import os
+import socket
+import sys
+
+from midcli.daemon.common import get_peer_uid, get_socket_path, is_socket_dir_secure
+
+__all__ = ["main"]
+
+
+class FallbackRequired(Exception):
+    pass
+
+
+def forward(argv):
+    path = get_socket_path()
+    if not is_socket_dir_secure(path):
+        # Never send the credentials and the terminal to a server that may belong to another user
+        raise FallbackRequired()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise FallbackRequired()
+
+        if get_peer_uid(sock) != os.getuid():
+            raise FallbackRequired()
+
+        request = json.dumps({"argv": argv, "cwd": os.getcwd()}).encode("utf-8") + b"\n"
+        socket.send_fds(sock, [request], [sys.stdin.fileno(), sys.stdout.fileno(), sys.stderr.fileno()])
+
+        response = b""
+        while not response.endswith(b"\n"):
+            try:
+                chunk = sock.recv(4096)
+            except KeyboardInterrupt:
+                # The command runs in the server's process group, so it did not receive this SIGINT
+                sock.shutdown(socket.SHUT_WR)
+                continue
+
+            if not chunk:
+                sys.stderr.write("CLI server closed the connection unexpectedly\n")
+                return 1
+
+            response += chunk
+    finally:
+        sock.close()
+
+    response = json.loads(response)
+    if response.get("fallback"):
+        raise FallbackRequired()
+
+    return response["status"]
+
+
+def main():
+    try:
+        status = forward(sys.argv[1:])
+    except FallbackRequired:
+        from midcli.__main__ import main
+        return main()
+
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
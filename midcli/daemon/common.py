@@ -0,0 +1,36 @@
+# -*- coding=utf-8 -*-
+# This module is imported by the thin client and must only depend on the standard library.
+import os
+import socket
+import stat
+import struct
+
+__all__ = ["get_socket_path", "is_socket_dir_secure", "get_peer_uid"]
+
+
+def get_socket_path():
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(runtime_dir, "midcli.sock")
+
+    return os.path.join("/tmp", f"midcli-{os.getuid()}", "midcli.sock")
+
+
+def is_socket_dir_secure(path):
+    """
+    Checks that the directory containing the socket `path` is a real directory (not a symlink) owned by the current
+    user and not accessible by anyone else (i.e. it was not created by another local user in a shared `/tmp`).
+    """
+    try:
+        st = os.lstat(os.path.dirname(path))
+    except FileNotFoundError:
+        return False
+
+    return stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and st.st_mode & 0o077 == 0
+
+
+def get_peer_uid(sock):
+    """
+    Returns the uid of the process on the other end of the connected UNIX socket `sock`.
+    """
+    pid, uid, gid = struct.unpack("3i", sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")))
+    return uid
@@ -0,0 +1,257 @@
+# -*- coding=utf-8 -*-
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+
+from prompt_toolkit.application.current import create_app_session
+
+from midcli.context import Namespace
+from midcli.pager import enable_pager
+
+from .common import get_peer_uid, get_socket_path, is_socket_dir_secure
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["serve"]
+
+# Seconds between checks whether the middleware was upgraded (and the warm context needs to be reloaded)
+VERSION_CHECK_INTERVAL = 10
+
+
+def serve(cli, parser, args):
+    """
+    Runs a resident server that executes `cli -c`/`cli --script` requests forwarded by `midcli.daemon.client`.
+
+    The server keeps a warm `cli.context` (imported modules, methods schema and fully built namespaces tree) and forks
+    a child for every request. The child takes over the client's stdin/stdout/stderr file descriptors (passed over the
+    UNIX socket), so the command output is streamed directly to the client terminal.
+
+    Requests that can't be served by this context (interactive sessions, another middleware URL or credentials) are
+    answered with a fallback response and the client executes them in-process.
+
+    When a request arrives more than `VERSION_CHECK_INTERVAL` seconds after the last check, `system.version` is
+    compared with the version the context was built for, and the context is reloaded if the middleware was upgraded.
+    """
+    _warm_up(cli)
+
+    path = get_socket_path()
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    if not is_socket_dir_secure(path):
+        sys.exit(f"CLI server socket directory {os.path.dirname(path)!r} must be owned by the current user and must "
+                 "not be accessible by anyone else")
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        pass
+    else:
+        sys.exit(f"CLI server is already running at {path!r}")
+    finally:
+        probe.close()
+
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o077)
+    try:
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+
+    print(f"CLI server is listening at {path!r}")
+    sys.stdout.flush()
+
+    version_checked_at = time.monotonic()
+    while True:
+        conn, _ = server.accept()
+
+        if time.monotonic() - version_checked_at > VERSION_CHECK_INTERVAL:
+            _reload_if_upgraded(cli)
+            version_checked_at = time.monotonic()
+
+        try:
+            _handle_connection(cli, parser, args, server, conn)
+        except Exception:
+            logger.error("Unhandled exception while handling CLI client connection", exc_info=True)
+            conn.close()
+
+
+def _warm_up(cli):
+    # Construct all the lazily created commands once so that every child inherits them
+    namespaces = [cli.context.namespaces.root]
+    while namespaces:
+        namespaces.extend(child for child in namespaces.pop().children if isinstance(child, Namespace))
+
+    # Children must not share the connections (and their reader threads) with the server, they will open their own
+    cli.context.client_pool.close()
+
+
+def _reload_if_upgraded(cli):
+    try:
+        with cli.context.get_client() as c:
+            if (version := c.call("system.version")) != cli.context.version:
+                logger.info("Middleware was upgraded from %r to %r, reloading", cli.context.version, version)
+                cli.context.reload()
+                cli.context.load_schema(c, version)
+                cli.context.call_cache.clear()
+    except Exception:
+        # Children will report the middleware errors themselves
+        logger.warning("Unable to check middleware version", exc_info=True)
+
+    _warm_up(cli)
+
+
+def _handle_connection(cli, parser, args, server, conn):
+    if (uid := get_peer_uid(conn)) != os.getuid():
+        logger.warning("Rejecting CLI client uid=%r", uid)
+        conn.close()
+        return
+
+    message, fds, _, _ = socket.recv_fds(conn, 65536, 3)
+    try:
+        while not message.endswith(b"\n"):
+            if not (chunk := conn.recv(65536)):
+                raise ValueError("Incomplete request")
+
+            message += chunk
+
+        if len(fds) != 3:
+            raise ValueError(f"Expected 3 file descriptors, got {len(fds)}")
+
+        request = json.loads(message)
+
+        try:
+            request_args = parser.parse_args(request["argv"])
+        except SystemExit:
+            # Let the client report the usage error
+            request_args = None
+
+        if request_args is None or not _can_serve(args, request_args):
+            conn.sendall(json.dumps({"fallback": True}).encode("utf-8") + b"\n")
+            conn.close()
+            return
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        child_pid = os.fork()
+        if child_pid == 0:
+            server.close()
+            conn.close()
+            _run_request(cli, request_args, request["cwd"], fds)
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+    threading.Thread(daemon=True, target=_wait_child, args=(conn, child_pid)).start()
+
+
+def _can_serve(args, request_args):
+    if request_args.daemon:
+        return False
+
+    if (request_args.command is None) == (request_args.script is None):
+        # Neither or both (the client reports the usage error)
+        return False
+
+    if request_args.interactive or request_args.menu or request_args.menu_item:
+        return False
+
+    if request_args.hosts_file or len(request_args.url or []) > 1:
+        # Multiple hosts are served by multiple contexts
+        return False
+
+    return all(getattr(request_args, k) == getattr(args, k) for k in ["url", "user", "password", "timeout"])
+
+
+def _wait_child(conn, pid):
+    finished = threading.Event()
+
+    def interrupt():
+        # Client sends EOF when it receives SIGINT
+        try:
+            conn.recv(1)
+        except OSError:
+            return
+
+        if not finished.is_set():
+            try:
+                os.kill(pid, signal.SIGINT)
+            except ProcessLookupError:
+                pass
+
+    threading.Thread(daemon=True, target=interrupt).start()
+
+    _, wait_status = os.waitpid(pid, 0)
+    finished.set()
+
+    try:
+        conn.sendall(json.dumps({"status": os.waitstatus_to_exitcode(wait_status)}).encode("utf-8") + b"\n")
+        # Wakes up the `interrupt` thread
+        conn.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    finally:
+        conn.close()
+
+
+def _run_request(cli, args, cwd, fds):
+    status = 1
+    try:
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+        for fd, target in zip(fds, [0, 1, 2]):
+            os.dup2(fd, target)
+
+        sys.stdin = io.TextIOWrapper(io.FileIO(0, "r", closefd=False))
+        sys.stdout = io.TextIOWrapper(io.FileIO(1, "w", closefd=False), line_buffering=os.isatty(1))
+        sys.stderr = io.TextIOWrapper(io.FileIO(2, "w", closefd=False), line_buffering=True)
+
+        os.chdir(cwd)
+
+        if args.pager:
+            enable_pager()
+
+        cli.context.editor = cli.create_editor(args.command, args.interactive, args.print_template, args.script)
+        cli.context.stacks = args.stacks
+        cli.context.page_size = args.page_size
+        cli.context.display_mode_manager.set_mode(args.mode or "table")
+
+        cli.command = args.command
+        cli.script = args.script
+        cli.continue_on_error = args.continue_on_error
+        cli.script_results = args.script_results
+
+        # Output objects must be created for the new stdout
+        with create_app_session():
+            cli.run()
+
+        status = 0
+    except SystemExit as e:
+        if e.code is None:
+            status = 0
+        elif isinstance(e.code, int):
+            status = e.code
+        else:
+            sys.stderr.write(f"{e.code}\n")
+    except KeyboardInterrupt:
+        status = 130
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(status)
@@ -1,5 +1,7 @@
 # -*- coding=utf-8 -*-
+import itertools
 import logging
+import sys
 
 from .polymorphic import PolymorphicDisplayMode
 from .text_mixin import TextMixin
@@ -23,6 +25,26 @@ class TableDisplayModeBase(PolymorphicDisplayMode, TextMixin):
 
         return self.display_table(header, objects)
 
+    def display_pages(self, pages):
+        # Header is determined from the first page only. That is only done when all of its rows have the same fields
+        # (otherwise the following pages are likely to have different fields too, and all the rows are retrieved
+        # first). Fields that still only appear later are not displayed, and a note is written to stderr.
+        pages = iter(pages)
+        first_page = next(pages, [])
+        if not first_page or not isinstance(first_page[0], dict) or not is_uniform(first_page):
+            return self.display_list(first_page + list(itertools.chain.from_iterable(pages)))
+
+        header = self._prepare_header(first_page)
+        if not header:
+            return self.display_list(first_page + list(itertools.chain.from_iterable(pages)))
+
+        missing = {}
+        return itertools.chain(
+            self.display_table_pages(header, first_page,
+                                     find_missing_fields(header, itertools.chain.from_iterable(pages), missing)),
+            report_missing_fields(missing),
+        )
+
     def display_object(self, object):
         if not object:
             return self.display_empty_object()
@@ -33,8 +55,18 @@ class TableDisplayModeBase(PolymorphicDisplayMode, TextMixin):
         return self.value_to_text(scalar)
 
     def display_table(self, header, objects):
+        """
+        `objects` is either a list or an iterator of rows.
+        """
         raise NotImplementedError
 
+    def display_table_pages(self, header, first_page, rows):
+        """
+        Displays a table whose `first_page` rows are already retrieved and the remaining `rows` (an iterator) are
+        retrieved as they are consumed.
+        """
+        return self.display_table(header, itertools.chain(first_page, rows))
+
     def display_empty_list(self):
         raise NotImplementedError
 
@@ -45,13 +77,60 @@ class TableDisplayModeBase(PolymorphicDisplayMode, TextMixin):
         raise NotImplementedError
 
     def _prepare_header(self, objects):
-        header = []
+        # Each key that was not seen before is placed right after the key that precedes it in its object (or at the
+        # end if it is the first key of its object). The header is kept as a linked list (`following` maps each key
+        # to the next one) so that both the lookup and the insertion take O(1).
+        first = None
+        last = None
+        following = {}
         for object in objects:
-            for prev, key in zip([None] + list(object.keys())[:-1], object.keys()):
-                if key not in header:
+            prev = None
+            for key in object:
+                if key not in following:
                     if prev is None:
-                        header.append(key)
+                        if last is None:
+                            first = key
+                        else:
+                            following[last] = key
+                        following[key] = None
+                        last = key
                     else:
-                        header.insert(header.index(prev) + 1, key)
+                        following[key] = following[prev]
+                        following[prev] = key
+                        if last == prev:
+                            last = key
+
+                prev = key
+
+        header = []
+        key = first
+        while key is not None:
+            header.append(key)
+            key = following[key]
 
         return header
+
+
+def is_uniform(objects):
+    keys = objects[0].keys()
+    return all(object.keys() == keys for object in objects)
+
+
+def find_missing_fields(header, objects, missing):
+    header = set(header)
+    for object in objects:
+        if not object.keys() <= header:
+            missing.update(dict.fromkeys(object.keys() - header))
+
+        yield object
+
+
+def report_missing_fields(missing):
+    if missing:
+        sys.stdout.flush()
+        sys.stderr.write(
+            f"Note: field(s) {', '.join(map(repr, missing))} first appeared after the first page and are not "
+            f"displayed. Run the query without --page-size to display them.\n"
+        )
+
+    yield from ()
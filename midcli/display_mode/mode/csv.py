@@ -13,16 +13,21 @@ __all__ = ["CsvDisplayMode"]
 
 
 class CsvDisplayMode(TableDisplayModeBase):
+    # Rows are written to the output in chunks of this size so that large results are never fully buffered
+    chunk_size = 100
+
     def display_table(self, header, objects):
         file = io.StringIO()
         writer = csv.writer(file)
         writer.writerow(header)
-        for object in objects:
+        for i, object in enumerate(objects, start=1):
             writer.writerow([
                 self.value_to_text(object.get(k, undefined))
                 for k in header
             ])
-        return file.getvalue()
+            if i % self.chunk_size == 0:
+                yield flush(file)
+        yield flush(file)
 
     def display_empty_list(self):
         return ""
@@ -32,3 +37,10 @@ class CsvDisplayMode(TableDisplayModeBase):
 
     def display_empty_header(self, count):
         return f"None of the specified fields found among {count} object(s)"
+
+
+def flush(file):
+    value = file.getvalue()
+    file.seek(0)
+    file.truncate()
+    return value
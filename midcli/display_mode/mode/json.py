@@ -0,0 +1,35 @@
+# -*- coding=utf-8 -*-
+import itertools
+import logging
+
+from truenas_api_client import ejson
+
+from .polymorphic import PolymorphicDisplayMode
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["JsonDisplayMode"]
+
+
+class JsonDisplayMode(PolymorphicDisplayMode):
+    def display_list(self, objects):
+        if not objects:
+            return "[]"
+
+        return self._stream_list(objects)
+
+    def display_pages(self, pages):
+        return self._stream_list(itertools.chain.from_iterable(pages))
+
+    def display_object(self, object):
+        return ejson.dumps(object)
+
+    def display_scalar(self, scalar):
+        return ejson.dumps(scalar)
+
+    def _stream_list(self, objects):
+        # One list item per line, serialized as soon as it is written
+        yield "["
+        for i, object in enumerate(objects):
+            yield ("," if i else "") + "\n" + ejson.dumps(object)
+        yield "\n]"
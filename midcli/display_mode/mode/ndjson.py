@@ -0,0 +1,26 @@
+# -*- coding=utf-8 -*-
+import itertools
+import logging
+
+from truenas_api_client import ejson
+
+from .polymorphic import PolymorphicDisplayMode
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["NdjsonDisplayMode"]
+
+
+class NdjsonDisplayMode(PolymorphicDisplayMode):
+    def display_list(self, objects):
+        for i, object in enumerate(objects):
+            yield ("\n" if i else "") + ejson.dumps(object)
+
+    def display_pages(self, pages):
+        return self.display_list(itertools.chain.from_iterable(pages))
+
+    def display_object(self, object):
+        return ejson.dumps(object)
+
+    def display_scalar(self, scalar):
+        return ejson.dumps(scalar)
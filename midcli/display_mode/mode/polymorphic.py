@@ -1,4 +1,5 @@
 # -*- coding=utf-8 -*-
+import itertools
 import logging
 
 from .interface import DisplayMode
@@ -18,6 +19,13 @@ class PolymorphicDisplayMode(DisplayMode):
 
         return self.display_scalar(value)
 
+    def display_pages(self, pages):
+        """
+        Displays a list that is retrieved page by page (`pages` is an iterable of lists). Modes that are able to
+        display the rows as they arrive should not retrieve the next page before the previous one is displayed.
+        """
+        return self.display_list(list(itertools.chain.from_iterable(pages)))
+
     def display_list(self, objects):
         raise NotImplementedError
 
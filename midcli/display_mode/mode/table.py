@@ -1,5 +1,7 @@
 # -*- coding=utf-8 -*-
+import itertools
 import logging
+import unicodedata
 
 from prettytable import PrettyTable
 
@@ -14,6 +16,9 @@ __all__ = ["TableDisplayMode"]
 
 
 class TableDisplayMode(TableDisplayModeBase, TextMixin):
+    # Tables with more rows than this are streamed row by row instead of being rendered with `PrettyTable`
+    stream_threshold = 1000
+
     def display_object(self, object):
         if not object:
             return self.display_empty_object()
@@ -24,6 +29,9 @@ class TableDisplayMode(TableDisplayModeBase, TextMixin):
         return pt.get_string(header=False)
 
     def display_table(self, header, objects):
+        if not isinstance(objects, list) or len(objects) > self.stream_threshold:
+            return self._stream_table(header, objects)
+
         table = [
             [
                 self.value_to_text(object.get(k, undefined))
@@ -38,6 +46,35 @@ class TableDisplayMode(TableDisplayModeBase, TextMixin):
             pt.add_row(row)
         return pt.get_string()
 
+    def display_table_pages(self, header, first_page, rows):
+        # Only the rows that are already retrieved are used to compute the column widths so that they are displayed
+        # before the next page is requested
+        return self._stream_table(header, itertools.chain(first_page, rows),
+                                  min(len(first_page), self.stream_threshold))
+
+    def _stream_table(self, header, objects, sample_size=None):
+        """
+        Yields the same table `PrettyTable` would render, line by line. Column widths are only computed from the first
+        `sample_size` (`stream_threshold` by default) rows; longer values in the following rows are truncated.
+        """
+        rows = (
+            [self.value_to_text(object.get(k, undefined)).split("\n") for k in header]
+            for object in objects
+        )
+        sample = list(itertools.islice(rows, self.stream_threshold if sample_size is None else sample_size))
+
+        widths = [text_width(k) for k in header]
+        for row in sample:
+            for i, lines in enumerate(row):
+                widths[i] = max(widths[i], *map(text_width, lines))
+
+        border = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+
+        yield border + "\n" + render_row([[k] for k in header], widths) + "\n" + border
+        for row in itertools.chain(sample, rows):
+            yield "\n" + render_row(row, widths)
+        yield "\n" + border
+
     def display_empty_list(self):
         return "(empty list)"
 
@@ -60,3 +97,40 @@ class TableDisplayMode(TableDisplayModeBase, TextMixin):
             return "\n".join(lines)
 
         return f"<{type(value).__name__}>"
+
+
+def render_row(row, widths):
+    return "\n".join(
+        "".join(
+            f"| {truncate(line, width)} "
+            for line, width in zip(lines, widths)
+        ) + "|"
+        for lines in itertools.zip_longest(*row, fillvalue="")
+    )
+
+
+def truncate(text, width):
+    """
+    Pads or truncates `text` to exactly `width` terminal columns.
+    """
+    if (text_width_ := text_width(text)) <= width:
+        return text + " " * (width - text_width_)
+
+    result = ""
+    result_width = 0
+    for char in text:
+        char_width = text_width(char)
+        if result_width + char_width > width - 3:
+            break
+
+        result += char
+        result_width += char_width
+
+    return result + "." * (width - result_width)
+
+
+def text_width(text):
+    return sum(
+        0 if unicodedata.combining(char) else 2 if unicodedata.east_asian_width(char) in ("F", "W") else 1
+        for char in text
+    )
@@ -11,8 +11,8 @@ __all__ = ["NonInteractiveEditor"]
 
 
 class NonInteractiveEditor(Editor):
-    def __init__(self):
-        if sys.stdin.isatty():
+    def __init__(self, read_stdin=True):
+        if not read_stdin or sys.stdin.isatty():
             self.available = False
             self.stdin = None
         else:
@@ -0,0 +1,130 @@
+# -*- coding=utf-8 -*-
+import concurrent.futures
+import itertools
+import logging
+import sys
+import urllib.parse
+
+from .command.interface import ProcessInputError
+from .display_mode.mode.interface import DisplayMode
+from .pager import echo_via_pager, enable_pager
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["get_urls", "read_hosts_file", "run_fanout"]
+
+
+class CollectingDisplayMode(DisplayMode):
+    """
+    Records the values that commands output instead of displaying them.
+    """
+
+    name = "collect"
+
+    def __init__(self):
+        self.values = []
+
+    def display(self, value):
+        self.values.append(value)
+        return ()
+
+    def display_pages(self, pages):
+        self.values.append(list(itertools.chain.from_iterable(pages)))
+        return ()
+
+
+def get_urls(args):
+    """
+    Returns the middleware URLs specified with `--url` (possibly multiple times) and `--hosts-file`.
+    """
+    urls = list(args.url or [])
+    if args.hosts_file:
+        urls.extend(read_hosts_file(args.hosts_file))
+
+    return urls
+
+
+def read_hosts_file(path):
+    """
+    Reads middleware URLs from the file (one per line, empty lines and lines starting with `#` are ignored).
+    """
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
+
+
+def run_fanout(create_cli, urls, command, workers=8, pager=False):
+    """
+    Runs `command` on all the `urls` concurrently (at most `workers` hosts at a time) using a separate CLI (and thus
+    `Context`) created with `create_cli(url)` for every host.
+
+    The outputs are merged into one list with an additional `host` column and displayed with the display mode of the
+    hosts' context. Failures are reported per host and do not prevent the command from running on the other hosts.
+
+    Returns the exit status.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [(url, executor.submit(_run_host, create_cli, url, command)) for url in urls]
+
+    mode = None
+    rows = []
+    errors = []
+    for url, future in futures:
+        host = get_host(url)
+        try:
+            mode, values = future.result()
+        except ProcessInputError as e:
+            errors.append((host, e.error.rstrip("\n")))
+        except SystemExit as e:
+            # `Context` exits when it is unable to connect to the middleware
+            errors.append((host, str(e.code)))
+        except Exception as e:
+            logger.debug("Error running command on %r", url, exc_info=True)
+            errors.append((host, repr(e)))
+        else:
+            rows.extend(merge_values(host, values))
+
+    if pager:
+        enable_pager()
+
+    if mode is not None and rows:
+        echo_via_pager(mode.display(rows))
+
+    for host, error in errors:
+        sys.stderr.write(f"{host}: {error}\n")
+
+    return 1 if errors else 0
+
+
+def _run_host(create_cli, url, command):
+    cli = create_cli(url)
+
+    mode = cli.context.display_mode_manager.mode
+    collector = CollectingDisplayMode()
+    cli.context.display_mode_manager.mode = collector
+
+    cli.context.process_input(command)
+
+    return mode, collector.values
+
+
+def get_host(url):
+    return urllib.parse.urlsplit(url).netloc or url
+
+
+def merge_values(host, values):
+    rows = []
+    for value in values:
+        if isinstance(value, list):
+            for item in value:
+                rows.append(_row(host, item))
+        elif value is not None:
+            rows.append(_row(host, value))
+
+    return rows
+
+
+def _row(host, value):
+    if isinstance(value, dict):
+        return {"host": host, **value}
+
+    return {"host": host, "result": value}
@@ -59,36 +59,54 @@ class NetworkInterfaceList(List):
                     c.call("interface.commit")
                 except ClientException as e:
                     return gui_handle_error(self.context, e, lambda _: NetworkInterfaceList(self.context))
+                finally:
+                    self.context.interface_status.refresh()
 
             return NetworkInterfaceList(self.context)
 
         def persist_app_factory():
             with self.context.get_client() as c:
-                c.call("interface.checkin")
+                try:
+                    c.call("interface.checkin")
+                finally:
+                    self.context.interface_status.refresh()
 
             return NetworkInterfaceList(self.context)
 
         def get_text():
-            with self.context.get_client() as c:
-                if checkin_waiting := c.call("interface.checkin_waiting"):
-                    n = int(checkin_waiting)
-                    return (
-                        f"Network interface changes have been applied.\n"
-                        f"Press <p> to persist them if the network is still operational\n"
-                        f"or they will be rolled back in {n} seconds."
-                    )
-                elif c.call("interface.has_pending_changes"):
-                    return (
-                        "You have pending network interface changes.\n"
-                        "Press <a> to apply them."
-                    )
+            status = self.context.interface_status.status()
+            if status.checkin_waiting is not None:
+                return (
+                    f"Network interface changes have been applied.\n"
+                    f"Press <p> to persist them if the network is still operational\n"
+                    f"or they will be rolled back in {status.checkin_waiting} seconds."
+                )
+            elif status.has_pending_changes:
+                return (
+                    "You have pending network interface changes.\n"
+                    "Press <a> to apply them."
+                )
 
         async def refresh():
-            while True:
-                label.text = await asyncio.get_running_loop().run_in_executor(None, get_text) or ""
-
-                self.app.invalidate()
-
-                await asyncio.sleep(1)
+            loop = asyncio.get_running_loop()
+            changed = asyncio.Event()
+            unsubscribe = self.context.interface_status.subscribe(lambda: loop.call_soon_threadsafe(changed.set))
+            try:
+                self.context.interface_status.start()
+                while True:
+                    label.text = get_text() or ""
+
+                    self.app.invalidate()
+
+                    # Only the check-in countdown needs to be redrawn periodically
+                    timeout = 1 if self.context.interface_status.status().checkin_waiting is not None else None
+                    try:
+                        await asyncio.wait_for(changed.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+
+                    changed.clear()
+            finally:
+                unsubscribe()
 
         self.app.pre_run_callables.append(lambda: self.app.create_background_task(refresh()))
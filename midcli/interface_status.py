@@ -0,0 +1,154 @@
+# -*- coding=utf-8 -*-
+import collections
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["InterfaceStatus", "InterfaceStatusMonitor"]
+
+InterfaceStatus = collections.namedtuple("InterfaceStatus", ["checkin_waiting", "has_pending_changes"])
+
+
+class InterfaceStatusMonitor:
+    """
+    Keeps track of the network interface changes status (`interface.checkin_waiting` and
+    `interface.has_pending_changes`) for all the parts of the UI that display it.
+
+    The status is refreshed when the middleware sends an `event` (with a full refresh every `max_interval` seconds as a
+    safety net). If the subscription is not possible, the status is polled every `interval` seconds, backing off up to
+    `max_interval` seconds while it does not change. `refresh()` forces an immediate refresh (i.e. after the CLI itself
+    has changed network interfaces).
+
+    `interface.query` events are only sent when interfaces are created, updated or deleted. There is no event for
+    `interface.commit`, `interface.checkin` or `interface.rollback`, so when these are called by another client (the
+    web UI, another shell) the status may lag for up to `max_interval` seconds. While a check-in countdown is active
+    the status is polled every `interval` seconds, so a check-in or a rollback is noticed as quickly as before.
+
+    The check-in countdown itself is computed locally so that it does not need to be polled.
+
+    `client_factory()` must create a new middleware connection. The monitor keeps it for as long as it works instead
+    of using one from the `ClientPool` so that it never takes a connection away from the commands.
+    """
+
+    event = "interface.query"
+
+    def __init__(self, client_factory, interval=1, max_interval=30):
+        self.client_factory = client_factory
+        self.interval = interval
+        self.max_interval = max_interval
+
+        self.lock = threading.Lock()
+        self.thread = None
+        self.wake = threading.Event()
+        self.callbacks = []
+
+        self.checkin_deadline = None
+        self.has_pending_changes = False
+
+    def start(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(daemon=True, target=self._run)
+                self.thread.start()
+
+    def status(self):
+        checkin_waiting = None
+        if (checkin_deadline := self.checkin_deadline) is not None:
+            checkin_waiting = max(int(checkin_deadline - time.monotonic()), 0)
+
+        return InterfaceStatus(checkin_waiting, self.has_pending_changes)
+
+    def subscribe(self, callback):
+        """
+        Calls `callback()` (from the monitor thread) every time the status changes. Returns a function that cancels
+        the subscription.
+        """
+        with self.lock:
+            self.callbacks.append(callback)
+
+        def unsubscribe():
+            with self.lock:
+                self.callbacks.remove(callback)
+
+        return unsubscribe
+
+    def refresh(self):
+        self.wake.set()
+
+    def _run(self):
+        interval = self.interval
+        while True:
+            self.wake.clear()
+            try:
+                with self.client_factory() as c:
+                    subscription = self._subscribe(c)
+                    try:
+                        while True:
+                            # Cleared before reading the status so that a `refresh()` requested while it is being read
+                            # is not lost
+                            self.wake.clear()
+                            if self._update(c):
+                                interval = self.interval
+                            else:
+                                interval = min(interval * 2, self.max_interval)
+
+                            self._wait(self.max_interval if subscription is not None else interval)
+                    finally:
+                        if subscription is not None:
+                            self._unsubscribe(c, subscription)
+            except Exception:
+                logger.debug("Error updating network interface status", exc_info=True)
+
+            # Reconnect
+            interval = min(interval * 2, self.max_interval)
+            self._wait(interval)
+
+    def _subscribe(self, c):
+        try:
+            return c.subscribe(self.event, lambda *args, **kwargs: self.refresh())
+        except Exception:
+            logger.debug("Unable to subscribe to %r, polling network interface status", self.event, exc_info=True)
+            return None
+
+    def _unsubscribe(self, c, subscription):
+        try:
+            c.unsubscribe(subscription)
+        except Exception:
+            pass
+
+    def _wait(self, timeout):
+        if self.checkin_deadline is not None:
+            # There are no events for check-in or rollback
+            timeout = min(timeout, self.interval)
+
+        self.wake.wait(timeout)
+
+    def _update(self, c):
+        checkin_deadline = None
+        has_pending_changes = False
+        if checkin_waiting := c.call("interface.checkin_waiting"):
+            checkin_deadline = time.monotonic() + int(checkin_waiting)
+        else:
+            has_pending_changes = bool(c.call("interface.has_pending_changes"))
+
+        changed = (
+            (checkin_deadline is None) != (self.checkin_deadline is None) or
+            has_pending_changes != self.has_pending_changes
+        )
+
+        self.checkin_deadline = checkin_deadline
+        self.has_pending_changes = has_pending_changes
+
+        if changed:
+            with self.lock:
+                callbacks = list(self.callbacks)
+
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception:
+                    logger.error("Unhandled exception in network interface status callback", exc_info=True)
+
+        return changed
@@ -1,5 +1,7 @@
 # -*- coding=utf-8 -*-
 import logging
+import os
+import sys
 
 import click
 
@@ -16,7 +18,30 @@ def enable_pager():
 
 
 def echo_via_pager(text):
-    if pager:
-        click.echo_via_pager(text)
-    else:
-        print(text)
+    """
+    `text` is either a string or an iterable of string chunks (that will be written as soon as they are produced).
+    An empty iterable writes nothing.
+
+    If stdout is closed by its reader (i.e. `cli -c "..." | head`), exits quietly.
+    """
+    try:
+        if pager:
+            click.echo_via_pager(text)
+        elif isinstance(text, str):
+            print(text)
+        else:
+            written = False
+            for chunk in text:
+                sys.stdout.write(chunk)
+                written = True
+
+            if written:
+                sys.stdout.write("\n")
+
+            sys.stdout.flush()
+    except BrokenPipeError:
+        # https://docs.python.org/3/library/signal.html#note-on-sigpipe
+        # Python flushes stdout at exit, which would fail again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
@@ -0,0 +1,72 @@
+# -*- coding=utf-8 -*-
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["SchemaCache"]
+
+FORMAT_VERSION = 1
+
+
+class SchemaCache:
+    """
+    On-disk cache of `core.get_methods` and `core.get_services` results.
+
+    There is one cache file per middleware URL and user. It is only considered valid if it was written for the same
+    middleware version (and by the same cache format version) and is discarded otherwise.
+    """
+
+    def __init__(self, url, user, path=None):
+        self.path = path or os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+            "midcli",
+        )
+        self.filename = os.path.join(
+            self.path,
+            "schema-" + hashlib.sha256(repr((url, user)).encode("utf-8")).hexdigest()[:16] + ".pickle",
+        )
+
+    def load(self, version):
+        try:
+            with open(self.filename, "rb") as f:
+                if os.fstat(f.fileno()).st_uid != os.getuid():
+                    logger.debug("Ignoring schema cache %r owned by another user", self.filename)
+                    return None
+
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug("Error reading schema cache %r", self.filename, exc_info=True)
+            return None
+
+        if data.get("format_version") != FORMAT_VERSION or data.get("version") != version:
+            return None
+
+        return data["methods"], data["services"]
+
+    def save(self, version, methods, services):
+        data = {
+            "format_version": FORMAT_VERSION,
+            "version": version,
+            "methods": methods,
+            "services": services,
+        }
+
+        try:
+            os.makedirs(self.path, mode=0o700, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile("wb", dir=self.path, prefix=".schema-", delete=False) as f:
+                try:
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    f.close()
+                    os.replace(f.name, self.filename)
+                except BaseException:
+                    os.unlink(f.name)
+                    raise
+        except Exception:
+            logger.debug("Error writing schema cache %r", self.filename, exc_info=True)
@@ -0,0 +1,62 @@
+# -*- coding=utf-8 -*-
+import json
+import logging
+import sys
+
+from .command.interface import ProcessInputError
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["run_script"]
+
+
+def run_script(context, lines, stop_on_error=True, results=None):
+    """
+    Executes CLI commands from `lines` (empty lines and lines starting with `#` are skipped) one by one, in the same
+    session.
+
+    If `results` file is given, a JSON object describing each executed command (its line number, text, exit status
+    and error message) is written there, one object per line.
+
+    Namespace banners are not displayed so that they do not get mixed with the commands output.
+
+    Returns `0` if all commands succeeded, `1` otherwise.
+    """
+    show_banners, context.show_banners = context.show_banners, False
+    try:
+        return _run_script(context, lines, stop_on_error, results)
+    finally:
+        context.show_banners = show_banners
+
+
+def _run_script(context, lines, stop_on_error, results):
+    status = 0
+    for lineno, line in enumerate(lines, start=1):
+        command = line.strip()
+        if not command or command.startswith("#"):
+            continue
+
+        error = None
+        try:
+            context.process_input(command)
+        except ProcessInputError as e:
+            error = e.error.rstrip("\n")
+            sys.stderr.write(error + "\n")
+
+        sys.stdout.flush()
+
+        if results is not None:
+            results.write(json.dumps({
+                "line": lineno,
+                "command": command,
+                "status": 0 if error is None else 1,
+                "error": error,
+            }) + "\n")
+            results.flush()
+
+        if error is not None:
+            status = 1
+            if stop_on_error:
+                break
+
+    return status
@@ -0,0 +1,61 @@
+# -*- coding=utf-8 -*-
+from collections import OrderedDict
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["LRUCache"]
+
+
+class LRUCache:
+    """
+    Thread-safe cache that keeps up to `maxsize` most recently used values.
+
+    `hits` and `misses` counters are kept for debugging.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self.lock = threading.Lock()
+        self.data = OrderedDict()
+
+    def get(self, key, compute):
+        """
+        Returns the value cached for `key` or computes it with `compute()` (and caches it).
+        """
+        with self.lock:
+            try:
+                value = self.data[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.data.move_to_end(key)
+                return value
+
+        value = compute()
+
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self.data), "maxsize": self.maxsize}
+
+    def __repr__(self):
+        return f"LRUCache<{', '.join(f'{k}={v}' for k, v in self.stats().items())}>"
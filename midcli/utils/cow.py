@@ -0,0 +1,28 @@
+# -*- coding=utf-8 -*-
+import logging
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["set_path", "update_path"]
+
+
+def set_path(obj, path, value):
+    """
+    Returns a copy of the nested dicts/lists `obj` with the item at `path` set to `value`.
+
+    Only the containers along the `path` are copied, everything else is shared with `obj` (which is not modified).
+    """
+    return update_path(obj, path, lambda _: value)
+
+
+def update_path(obj, path, update):
+    """
+    Same as `set_path` but sets the item at `path` to `update(item)`.
+    """
+    if not path:
+        return update(obj)
+
+    key, *rest = path
+    obj = obj.copy()
+    obj[key] = update_path(obj[key], rest, update)
+    return obj
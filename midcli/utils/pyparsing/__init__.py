@@ -1,6 +1,42 @@
 # -*- coding=utf-8 -*-
 import logging
+import os
+
+import pyparsing as pp
 
 logger = logging.getLogger(__name__)
 
-__all__ = []
+__all__ = ["configure_packrat"]
+
+PACKRAT_DEFAULT_CACHE_SIZE = 128
+
+
+def configure_packrat(value):
+    """
+    Enables pyparsing packrat memoization according to the `MIDCLI_PYPARSING_PACKRAT` environment variable value:
+    empty or `0` leaves it disabled, `1` enables it with the default cache size and a larger number sets the cache
+    size.
+
+    Packrat is disabled by default: on typical command lines the CLI grammars do not backtrack enough for the
+    memoization to pay off (see `tests/utils/test_pyparsing_packrat.py`).
+    """
+    if not value:
+        return False
+
+    try:
+        cache_size = int(value)
+    except ValueError:
+        logger.warning("Invalid MIDCLI_PYPARSING_PACKRAT value: %r", value)
+        return False
+
+    if cache_size <= 0:
+        return False
+
+    if cache_size == 1:
+        cache_size = PACKRAT_DEFAULT_CACHE_SIZE
+
+    pp.ParserElement.enable_packrat(cache_size_limit=cache_size)
+    return True
+
+
+configure_packrat(os.environ.get("MIDCLI_PYPARSING_PACKRAT"))
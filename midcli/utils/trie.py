@@ -0,0 +1,64 @@
+# -*- coding=utf-8 -*-
+import logging
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["PrefixTrie"]
+
+
+class PrefixTrieNode:
+    __slots__ = ("children", "values")
+
+    def __init__(self):
+        self.children = {}
+        self.values = []
+
+
+class PrefixTrie:
+    """
+    Maps string keys to values and allows retrieving all the values stored under the keys that start with a given
+    prefix in O(len(prefix) + number of matches) time.
+    """
+
+    def __init__(self):
+        self.root = PrefixTrieNode()
+
+    def add(self, key, value):
+        node = self.root
+        for char in key:
+            node = node.children.setdefault(char, PrefixTrieNode())
+
+        node.values.append(value)
+
+    def get(self, key):
+        """
+        Returns values stored under exactly this `key`.
+        """
+        if (node := self._node(key)) is None:
+            return []
+
+        return list(node.values)
+
+    def get_prefix(self, prefix):
+        """
+        Returns values stored under all the keys that start with `prefix`.
+        """
+        if (node := self._node(prefix)) is None:
+            return []
+
+        values = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            values.extend(node.values)
+            stack.extend(node.children.values())
+
+        return values
+
+    def _node(self, key):
+        node = self.root
+        for char in key:
+            if (node := node.children.get(char)) is None:
+                return None
+
+        return node
@@ -24,6 +24,7 @@ setup(
         'console_scripts': [
             'cli = midcli.__main__:main',
             'cli_console = midcli.__main__:main_console',
+            'cli_client = midcli.daemon.client:main',
         ],
     },
 )
@@ -1,7 +1,10 @@
 # -*- coding=utf-8 -*-
+
+import pyparsing
 import pytest
 
-from midcli.command.common_syntax.parse import AutocompleteName, AutocompleteValue, get_autocomplete
+from midcli.command.common_syntax.parse import (AutocompleteName, AutocompleteValue, autocomplete, get_autocomplete,
+                                               get_value, parse_autocomplete)
 
 
 @pytest.mark.parametrize("s,result", [
@@ -24,3 +27,50 @@ from midcli.command.common_syntax.parse import AutocompleteName, AutocompleteVal
 ])
 def test__get_autocomplete(s, result):
     assert get_autocomplete(s) == result
+
+
+CORPUS = [
+    'username password="i v" key=',
+    'eth0 aliases=192.168.0.1/24,10.0.0.1/8 mtu=9000',
+    'id=6 data={"a": [1, 2, {"b": null}], "c": "d e"} --',
+    '1 0x1f 0o17 "a b" [1, 2] {"x": true} name=value',
+    'a =b c',
+    'a b=1 c d=2',
+    'alias1,alias2 "x\ty" list=[ 1, 2 ,3 ]',
+    'a\nb',
+    'a b\n',
+]
+
+
+def parse_autocomplete_reference(text):
+    try:
+        result = dict(autocomplete.parseString(text + " ", parseAll=True).items())
+    except pyparsing.ParseException:
+        return None
+
+    result["rest"] = result["rest"][:-1]
+    if not result["rest"]:
+        del result["rest"]
+
+    for key in ["arg_value", "kwarg_value"]:
+        if key in result:
+            result[key] = list(map(get_value, result[key]))
+
+    if "kwarg_name" in result:
+        result["kwarg_name"] = list(result["kwarg_name"])
+
+    return result
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_parse_autocomplete_while_typing(text):
+    for i in range(len(text) + 1):
+        assert parse_autocomplete(text[:i]) == parse_autocomplete_reference(text[:i]), text[:i]
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_parse_autocomplete_after_edit(text):
+    for i in range(len(text)):
+        parse_autocomplete(text)
+        edited = text[:i] + "=" + text[i + 1:]
+        assert parse_autocomplete(edited) == parse_autocomplete_reference(edited), edited
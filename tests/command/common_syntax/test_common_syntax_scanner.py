@@ -0,0 +1,133 @@
+# -*- coding=utf-8 -*-
+import itertools
+import random
+import timeit
+
+import pyparsing
+import pytest
+
+from midcli.command.common_syntax.parse import command, get_value
+from midcli.command.common_syntax.scanner import scan_arguments
+
+COMMON = [
+    "",
+    "1",
+    "0o10 0x10 -5 +7 1.5 007",
+    "null true false",
+    "ivan_ivanov123 /mnt/tank root@localhost .history",
+    "[1, 2, 3] {\"key\": [\"nested\", {\"value\": 2}]}",
+    "1 1,2,3",
+    "1 1,2, 3",
+    "a,b,c 1",
+    "1 \"a,b\",\"c, d\"",
+    "option=2",
+    "1 2 option=3 another_option=\"4\"",
+    "name= ivan name2 =ivan name3 = ivan",
+    "aliases=192.168.0.1/24,10.0.0.1/8 mtu=9000",
+    "data={\"a\": {\"b\": [1.5, -2, 1e5, null]}, \"a\": 2}",
+    "auxsmbconf=\"force group=apps\\nforce user=apps\"",
+    "--",
+    "1 option=2\t-- ",
+    "1 option=2 > file.tar.gz",
+    "1 option=2 -- > /root/file.tar.gz",
+    "-->file",
+    "x  1,2",
+    "x  \"a\",b",
+    "x  true,1",
+    "[1],[2]",
+    "null_x trueish",
+    "value=\"\\u00e9\\t\"",
+    "NaN",
+    "1\n2",
+]
+
+UNCOMMON = [
+    "1a",
+    "1 option=2 3",
+    "  a,b",
+    "x a,b",
+    "x a,  b",
+    "a ,b",
+    "a=  b,c",
+    "null.x",
+    "true/1",
+    ".5",
+    "1.",
+    "1e5",
+    "0o19",
+    "0x",
+    "[NaN]",
+    "{\"a\": 1, /* comment */ \"b\": 2}",
+    "\"a\"\"b\"",
+    "[1]x",
+    "a.b=1",
+    "a= =1",
+    "=1",
+    "1 =2",
+    "-- 1",
+    "> ",
+    "> fïle",
+    "ü",
+    "a=ü",
+    "[1,",
+    "{\"a\" 1}",
+    "\"unterminated",
+]
+
+PIECES = [
+    "1", "-1", "0x1F", "0o7", "1.5", "null", "true", "a", "a/b.c", "@x", "\"s t\"", "\"a,b\"", "[1, \"x\"]",
+    "{\"k\": [true]}", "a,b", "1,2", "\"x\",y", "k=1", "k=a,b", "k= x", "k =\"v\"", "k=[1]", "--", "> out", "=",
+    ",", " ", "  ", "\t", "x1,", "1a", ".5",
+]
+
+
+def parse_reference(text):
+    try:
+        result = dict(command.parseString(text + " ", parseAll=True).items())
+    except pyparsing.ParseException:
+        return None
+
+    return (
+        list(map(get_value, result.get("arg_value", []))),
+        dict(zip(result.get("kwarg_name", []), map(get_value, result.get("kwarg_value", [])))),
+        "interactive" in result,
+        result.get("output"),
+    )
+
+
+@pytest.mark.parametrize("text", COMMON)
+def test_common(text):
+    assert scan_arguments(text) == parse_reference(text)
+
+
+@pytest.mark.parametrize("text", UNCOMMON)
+def test_uncommon(text):
+    assert scan_arguments(text) is None
+
+
+def test_random():
+    rnd = random.Random(0)
+    scanned = 0
+    for _ in range(3000):
+        text = " ".join(rnd.choice(PIECES) for _ in range(rnd.randint(1, 6)))
+        if (result := scan_arguments(text)) is not None:
+            scanned += 1
+            assert result == parse_reference(text), text
+
+    assert scanned > 0
+
+
+def test_benchmark():
+    text = " ".join(itertools.chain(
+        ["eth0", "1", "/mnt/tank/dataset"],
+        [f"option{i}=\"value {i}\"" for i in range(20)],
+        ["aliases=" + ",".join(f"10.0.{i}.1/24" for i in range(20))],
+        ["data={\"a\": [1, 2, 3], \"b\": {\"c\": null}}"],
+    ))
+    assert scan_arguments(text) == parse_reference(text)
+
+    pyparsing_time = min(timeit.repeat(lambda: parse_reference(text), number=10, repeat=3))
+    scanner_time = min(timeit.repeat(lambda: scan_arguments(text), number=10, repeat=3))
+    print(f"pyparsing: {pyparsing_time / 10 * 1000:.3f}ms, scanner: {scanner_time / 10 * 1000:.3f}ms")
+
+    assert scanner_time < pyparsing_time
@@ -1,4 +1,5 @@
 # -*- coding=utf-8 -*-
+import copy
 from unittest.mock import ANY, Mock
 
 import pytest
@@ -69,3 +70,26 @@ def test_update_call_args(text, is_interactive, call_args):
         else:
             command.process_input(text)
             command.call.assert_called_once_with("user.update", *call_args, job=False)
+
+
+def test_editor_does_not_modify_method():
+    method = copy.deepcopy(USER_UPDATE)
+    command = UpdateCommand(Mock(), Mock(), "update", None, "user.update", method=method, splice_kwargs=1)
+    client = Mock()
+    client.call.return_value = {"uid": 1000, "username": "alice"}
+    command.context = Mock()
+    command.context.get_client.return_value = Mock(__enter__=Mock(return_value=client), __exit__=Mock())
+    command._run_editor = Mock()
+
+    command.process_input("1000")
+
+    editor_method = command._run_editor.call_args[0][3]
+    assert editor_method["accepts"][1]["properties"]["username"] == {
+        "_name_": "username",
+        "_required_": False,
+        "title": "Username",
+        "type": "string",
+        "default": "alice",
+    }
+    assert method == USER_UPDATE
+    assert command.method is method
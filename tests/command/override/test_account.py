@@ -0,0 +1,91 @@
+# -*- coding=utf-8 -*-
+import contextlib
+import copy
+from unittest.mock import Mock
+
+import pytest
+
+from truenas_api_client import ValidationErrors
+
+from midcli.command.override.account import AccountCommandMixin, AccountUpdateCommand
+
+GROUPS = [
+    {"id": 1, "group": "wheel", "gid": 0},
+    {"id": 2, "group": "staff", "gid": 50},
+    {"id": 3, "group": "builtin_users", "gid": 545},
+]
+
+
+def get_command():
+    client = Mock()
+
+    def query(filter, options):
+        def matches(group, f):
+            if f[0] == "OR":
+                return any(matches(group, f_) for f_ in f[1])
+
+            return group[f[0]] in f[2]
+
+        return [group for group in GROUPS if all(matches(group, f) for f in filter)]
+
+    client.call.side_effect = lambda method, *args: query(*args)
+
+    @contextlib.contextmanager
+    def get_client():
+        yield client
+
+    command = AccountCommandMixin()
+    command.context = Mock(get_client=get_client)
+    command.method = {"accepts": [{"_name_": "user_create"}]}
+    return command, client
+
+
+@pytest.mark.parametrize("value,result", [
+    ({"group": "wheel"}, {"group": 1}),
+    ({"group": 50}, {"group": 2}),
+    ({"groups": ["wheel", 545, "staff"]}, {"groups": [1, 3, 2]}),
+    ({"group": "staff", "groups": [0, "staff"]}, {"group": 2, "groups": [1, 2]}),
+    ({"groups": []}, {"groups": []}),
+    ({"username": "alice"}, {"username": "alice"}),
+])
+def test_process_value(value, result):
+    command, client = get_command()
+    original = copy.deepcopy(value)
+
+    assert command._process_value(value) == result
+    assert value == original
+    assert client.call.call_count <= 1
+
+
+@pytest.mark.parametrize("value,attribute,error", [
+    ({"group": "nonexistent", "groups": ["nonexistent"]}, "user_create.group", "Group 'nonexistent' does not exist"),
+    ({"groups": ["wheel", 1000, "nonexistent"]}, "user_create.groups.1", "Group 1000 does not exist"),
+    ({"groups": [0, 1000, None]}, "user_create.groups.1", "Group 1000 does not exist"),
+    ({"groups": [0, None, 1000]}, "user_create.groups.1", "Group None does not exist"),
+    ({"groups": ["wheel", [50], 1.5]}, "user_create.groups.1", "Group [50] does not exist"),
+    ({"group": None, "groups": ["wheel"]}, "user_create.group", "Group None does not exist"),
+])
+def test_process_value_does_not_exist(value, attribute, error):
+    command, client = get_command()
+
+    with pytest.raises(ValidationErrors) as e:
+        command._process_value(value)
+
+    assert [(err.attribute, err.errmsg) for err in e.value.errors] == [(attribute, error)]
+    assert client.call.call_count == 1
+
+
+def test_process_method_does_not_modify_method():
+    method = {
+        "accepts": [
+            {"_name_": "id", "type": "integer"},
+            {"properties": {"group": {"type": "integer"}, "groups": {"type": "array"}}},
+        ],
+    }
+    original = copy.deepcopy(method)
+
+    result = AccountUpdateCommand._process_method(Mock(), method)
+
+    assert result["accepts"][0] == {"_name_": "uid_or_username", "type": ["integer", "string"]}
+    assert result["accepts"][1]["properties"]["group"] == {"type": ["integer", "string"]}
+    assert method == original
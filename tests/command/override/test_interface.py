@@ -0,0 +1,14 @@
+# -*- coding=utf-8 -*-
+import copy
+
+from midcli.command.override.interface import InterfaceCreateCommand
+
+
+def test_process_call_args_does_not_modify_args():
+    args = ({"name": "br0", "aliases": ["192.168.0.1/24"]},)
+    original = copy.deepcopy(args)
+
+    result = InterfaceCreateCommand._process_call_args(InterfaceCreateCommand.__new__(InterfaceCreateCommand), args)
+
+    assert result == [{"name": "br0", "aliases": [{"type": "INET", "address": "192.168.0.1", "netmask": 24}]}]
+    assert args == original
@@ -0,0 +1,60 @@
+# -*- coding=utf-8 -*-
+import contextlib
+from unittest.mock import Mock
+
+from midcli.call_cache import CallCache
+from midcli.command.override.utils import lookup_table, rows_processor
+
+
+def create_context(rows):
+    client = Mock()
+    client.call.side_effect = lambda method, filters, options: [
+        {k: v for k, v in row.items() if k in options["select"]}
+        for row in rows
+    ]
+
+    context = Mock()
+    context.call_cache = CallCache()
+    context.get_client = lambda: contextlib.nullcontext(client)
+    return context, client
+
+
+def test_lookup_table_is_cached():
+    context, client = create_context([{"id": 1, "group": "wheel", "gid": 0}])
+
+    assert lookup_table(context, "group", "id", "group") == {1: "wheel"}
+    assert lookup_table(context, "group", "id", "group", {1}) == {1: "wheel"}
+
+    client.call.assert_called_once_with("group.query", [], {"select": ["id", "group"]})
+
+
+def test_lookup_table_is_invalidated():
+    context, client = create_context([{"id": 1, "group": "wheel"}])
+
+    lookup_table(context, "group", "id", "group")
+    context.call_cache.invalidate("group")
+    lookup_table(context, "group", "id", "group")
+
+    assert client.call.call_count == 2
+
+
+def test_lookup_table_refetched_for_unknown_keys():
+    rows = [{"id": 1, "group": "wheel"}]
+    context, client = create_context(rows)
+
+    lookup_table(context, "group", "id", "group")
+    rows.append({"id": 2, "group": "staff"})
+
+    assert lookup_table(context, "group", "id", "group", {1, 2}) == {1: "wheel", 2: "staff"}
+    assert client.call.call_count == 2
+
+
+def test_rows_processor_requires_produces():
+    @rows_processor(requires=["groups"], produces=["groups"])
+    def processor(context, rows):
+        for row in rows:
+            row["groups"] = len(row["groups"])
+
+    assert processor.requires == ["groups"]
+    assert processor.produces == ["groups"]
+    assert processor(Mock(), [{"groups": [1, 2]}]) == [{"groups": 2}]
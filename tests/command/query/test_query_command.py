@@ -0,0 +1,208 @@
+# -*- coding=utf-8 -*-
+import contextlib
+from unittest.mock import Mock, patch
+
+import pytest
+
+from midcli.command.interface import ProcessInputError
+from midcli.command.override.account import AccountQueryCommand
+from midcli.command.override.interface import InterfaceQueryCommand
+from midcli.command.query.command import QueryCommand, output_processor, validate_column
+from midcli.command.query.parse import ParsedQueryCommand
+from midcli.display_mode.mode.json import JsonDisplayMode
+from midcli.display_mode.mode.ndjson import NdjsonDisplayMode
+from midcli.display_mode.mode.table import TableDisplayMode
+
+ROWS = [{"id": i, "name": f"item{i}"} for i in range(1, 8)]
+
+
+def create_command(page_size, mode, command_class=QueryCommand):
+    client = Mock()
+    client.call.side_effect = lambda name, filters, options, **kwargs: (
+        ROWS[options.get("offset", 0):][:options.get("limit")]
+    )
+
+    context = Mock()
+    context.page_size = page_size
+    context.get_client = lambda: contextlib.nullcontext(client)
+    context.display_mode_manager.mode = mode
+
+    command = command_class(context, Mock(), "query", method={"name": "test.query"})
+    return command, client
+
+
+@pytest.mark.parametrize("mode", [JsonDisplayMode(), NdjsonDisplayMode(), TableDisplayMode()])
+def test_paged_output_matches_unpaged(mode):
+    results = []
+    for page_size in [None, 3]:
+        command, client = create_command(page_size, mode)
+        with patch("midcli.command.call_mixin.echo_via_pager") as echo1:
+            with patch("midcli.command.query.command.echo_via_pager") as echo2:
+                echo1.side_effect = echo2.side_effect = lambda output: results.append(
+                    output if isinstance(output, str) else "".join(output)
+                )
+                command.process_input("")
+
+    assert results[0] == results[1]
+    assert client.call.call_count == 3
+
+
+def test_pages_are_fetched_lazily():
+    command, client = create_command(3, NdjsonDisplayMode())
+    with patch("midcli.command.query.command.echo_via_pager") as echo:
+        echo.side_effect = lambda output: next(iter(output))
+        command.process_input("")
+
+    assert client.call.call_count == 1
+    assert client.call.call_args[0][2] == {"limit": 3, "offset": 0}
+
+
+@pytest.mark.parametrize("options", [{"get": True}, {"count": True}, {"limit": 2}, {"offset": 2}])
+def test_explicit_options_disable_paging(options):
+    command, client = create_command(3, NdjsonDisplayMode())
+    with patch("midcli.command.query.command.parse", Mock(return_value=ParsedQueryCommand([], options))):
+        with patch("midcli.command.call_mixin.echo_via_pager"):
+            command.process_input("")
+
+    assert client.call.call_count == 1
+
+
+def test_output_processors_disable_paging():
+    command, client = create_command(3, NdjsonDisplayMode())
+    command.output_processors = [Mock(side_effect=lambda context, rv: rv, requires=None, produces=None)]
+    with patch("midcli.command.call_mixin.echo_via_pager"):
+        command.process_input("")
+
+    assert client.call.call_count == 1
+    assert client.call.call_args[0][2] == {}
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+        "state": {
+            "type": "object",
+            "properties": {
+                "aliases": {"type": "array"},
+                "link_state": {"type": "string"},
+            },
+        },
+        "attributes": {"type": "object", "properties": {}, "additionalProperties": True},
+    },
+}
+
+
+@pytest.mark.parametrize("column,valid", [
+    ("name", True),
+    ("state.aliases", True),
+    ("state.unknown", False),
+    ("unknown", False),
+    ("attributes.anything", True),
+    ("name.length", True),
+])
+def test_validate_column(column, valid):
+    assert validate_column(SCHEMA, column) == valid
+
+
+@pytest.mark.parametrize("rv,result", [
+    ({"name": "eth0"}, {"name": "eth0"}),
+    ({"name": "eth0", "state": {"aliases": [1], "link_state": "UP"}}, {"name": "eth0", "state.aliases": [1]}),
+    ({"name": "eth0", "state.aliases": [1], "state": {}}, {"name": "eth0", "state.aliases": [1]}),
+    ({"name": "eth0", "state": None}, {"name": "eth0"}),
+])
+def test_output_processor(rv, result):
+    assert output_processor(["name", "state.aliases"], rv) == result
+
+
+def test_output_processor_does_not_copy_honoured_selection():
+    rv = {"name": "eth0"}
+    assert output_processor(["name", "state.aliases"], rv) is rv
+
+
+def test_select_is_pushed_down():
+    command, client = create_command(None, NdjsonDisplayMode())
+    command.method["filterable_schema"] = SCHEMA
+    with patch("midcli.command.call_mixin.echo_via_pager"):
+        command.process_input("name,state.aliases")
+
+    assert client.call.call_args[0][2] == {"select": ["name", "state.aliases"]}
+
+
+def test_select_is_validated():
+    command, client = create_command(None, NdjsonDisplayMode())
+    command.method["filterable_schema"] = SCHEMA
+    with pytest.raises(ProcessInputError) as e:
+        command.process_input("name,state.unknown")
+
+    assert e.value.error == "Unknown column: 'state.unknown'"
+    client.call.assert_not_called()
+
+
+def test_select_is_not_pushed_down_with_output_processors():
+    command, client = create_command(None, NdjsonDisplayMode())
+    command.output_processors = [Mock(side_effect=lambda context, rv: rv, requires=None, produces=None)]
+    with patch("midcli.command.call_mixin.echo_via_pager"):
+        command.process_input("name")
+
+    assert client.call.call_args[0][2] == {}
+
+
+@pytest.mark.parametrize("query,called", [
+    ("", True),
+    ("name", False),
+    ("name,groups", True),
+    ("groups.0", True),
+])
+def test_output_processor_skipped_if_columns_are_not_selected(query, called):
+    command, client = create_command(None, NdjsonDisplayMode())
+    processor = Mock(side_effect=lambda context, rv: rv, requires=["groups"], produces=["groups"])
+    command.output_processors = [processor]
+    with patch("midcli.command.call_mixin.echo_via_pager"):
+        command.process_input(query)
+
+    assert processor.called == called
+
+
+@pytest.mark.parametrize("command_class,query,server_select,rows,result", [
+    (
+        AccountQueryCommand,
+        "username,uid",
+        ["username", "uid"],
+        [{"username": "root", "uid": 0}],
+        [{"username": "root", "uid": 0}],
+    ),
+    (
+        AccountQueryCommand,
+        "username,group",
+        ["username", "group"],
+        [{"username": "root", "group": {"id": 1, "bsdgrp_gid": 0}}],
+        [{"username": "root", "group": {"gid": 0}}],
+    ),
+    (
+        InterfaceQueryCommand,
+        "name,state.aliases",
+        ["name", "state", "aliases"],
+        [{"name": "eth0", "state": {"aliases": [{"type": "INET", "address": "10.0.0.1", "netmask": 24}]},
+          "aliases": []}],
+        [{"name": "eth0", "state.aliases": ["10.0.0.1/24"]}],
+    ),
+    (
+        InterfaceQueryCommand,
+        "name,type",
+        ["name", "type"],
+        [{"name": "eth0", "type": "PHYSICAL"}],
+        [{"name": "eth0", "type": "PHYSICAL"}],
+    ),
+])
+def test_select_requests_required_fields(command_class, query, server_select, rows, result):
+    command, client = create_command(None, NdjsonDisplayMode(), command_class)
+    client.call.side_effect = None
+    client.call.return_value = rows
+
+    with patch.object(command, "_handle_output") as handle_output:
+        command.process_input(query)
+
+    assert client.call.call_args[0][2] == {"select": server_select}
+    handle_output.assert_called_once_with(result)
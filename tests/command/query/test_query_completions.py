@@ -44,6 +44,13 @@ USER_FILTERABLE_SCHEMA = {
 }
 
 
+def keywords(*keywords, prefix="", space=False):
+    return [Completion(f" {keyword}" if space else keyword, -len(prefix)) for keyword in keywords]
+
+
+CLAUSES = ["WHERE", "ORDER BY", "LIMIT", "OFFSET"]
+
+
 def fields_for(prefix, exclude=None):
     exclude = exclude or []
 
@@ -60,9 +67,9 @@ def fields_for(prefix, exclude=None):
     ("up", []),
     ("uid,", fields_for("", exclude=["uid"])),
     ("uid,u", fields_for("u", exclude=["uid"])),
-    ("uid,u ", [Completion("WHERE", 0)]),
+    ("uid,u ", keywords(*CLAUSES)),
     ("uid,username", []),
-    ("uid,username ", [Completion("WHERE", 0)]),
+    ("uid,username ", keywords(*CLAUSES)),
     ("uid,username WHERE", []),
     ("uid,username WHERE ", fields_for("")),
     ("uid,username WHERE u", fields_for("u")),
@@ -70,15 +77,33 @@ def fields_for(prefix, exclude=None):
     ("uid,username WHERE uid >", []),
     ("uid,username WHERE uid > ", []),
     ("uid,username WHERE uid > 6", []),
-    ("uid,username WHERE uid > 6 ", []),
+    ("uid,username WHERE uid > 6 ", keywords("ORDER BY", "LIMIT", "OFFSET")),
+    ("uid,username WHERE uid > 6 or", []),
+    ("uid,username WHERE uid > 6 OR", keywords("ORDER BY", prefix="OR")),
+    ("uid,username WHERE uid > 6 or ", fields_for("")),
+    ("uid,username WHERE uid > 6 L", keywords("LIMIT", prefix="L")),
+    ("uid,username WHERE uid > 6 ord", keywords("ORDER BY", prefix="ord")),
     ("uid,username WHERE uid > 6 a", []),
     ("uid,username WHERE uid > 6 and", []),
     ("uid,username WHERE uid > 6 and ", fields_for("")),
     ("uid,username WHERE uid > 6 and u", fields_for("u")),
     ("uid,username WHERE (", fields_for("")),
     ("uid,username WHERE (u", fields_for("u")),
-    ("*", [Completion(" WHERE", 0)]),
-    ("* ", [Completion("WHERE", 0)]),
+    ("*", keywords(*CLAUSES, space=True)),
+    ("* ", keywords(*CLAUSES)),
+    ("* O", keywords("ORDER BY", "OFFSET", prefix="O")),
+    ("COUNT(*) ", keywords(*CLAUSES)),
+    ("* ORDER BY ", fields_for("")),
+    ("* ORDER BY u", fields_for("u")),
+    ("* ORDER BY uid ", keywords("ASC", "DESC", "LIMIT", "OFFSET")),
+    ("* ORDER BY uid D", keywords("DESC", prefix="D")),
+    ("* ORDER BY uid DESC ", keywords("LIMIT", "OFFSET")),
+    ("* ORDER BY uid,", fields_for("", exclude=["uid"])),
+    ("* WHERE uid > 6 ORDER BY uid DESC LIMIT 10 ", keywords("OFFSET")),
+    ("* LIMIT 10 OFFSET 10 ", []),
+    ("* WHERE uid > 6 LIMIT ", []),
+    ("* WHERE uid > 6 ORDER BY ", fields_for("")),
+    ("* WHERE limit == 5 ", keywords("ORDER BY", "LIMIT", "OFFSET")),
     ("#", []),
 ])
 def test_autocomplete(text, completions):
@@ -1,6 +1,7 @@
 # -*- coding=utf-8 -*-
 import pytest
 
+from midcli.command.query.cache import query_cache
 from midcli.command.query.parse import ParsedQueryCommand, parse, ParseError
 
 
@@ -42,6 +43,28 @@ from midcli.command.query.parse import ParsedQueryCommand, parse, ParseError
     ("* WHERE smb_account == null", ParsedQueryCommand(
         [["smb_account", "=", None]], {},
     )),
+    ("COUNT(*)", ParsedQueryCommand([], {"count": True})),
+    ("count(*) WHERE uid > 0", ParsedQueryCommand([["uid", ">", 0]], {"count": True})),
+    ("count", ParsedQueryCommand([], {"select": ["count"]})),
+    ("* ORDER BY uid", ParsedQueryCommand([], {"order_by": ["uid"]})),
+    ("uid ORDER BY uid DESC, username asc", ParsedQueryCommand(
+        [], {"select": ["uid"], "order_by": ["-uid", "username"]},
+    )),
+    ("* LIMIT 10", ParsedQueryCommand([], {"limit": 10})),
+    ("* LIMIT 10 OFFSET 20", ParsedQueryCommand([], {"limit": 10, "offset": 20})),
+    ("* WHERE username == 'LIMIT 1' order by uid limit 1", ParsedQueryCommand(
+        [["username", "=", "LIMIT 1"]], {"order_by": ["uid"], "limit": 1},
+    )),
+    ("username WHERE limit == 5", ParsedQueryCommand([["limit", "=", 5]], {"select": ["username"]})),
+    ("username WHERE offset > 5 LIMIT 2", ParsedQueryCommand(
+        [["offset", ">", 5]], {"select": ["username"], "limit": 2},
+    )),
+    ("username WHERE order == 1 ORDER BY uid", ParsedQueryCommand(
+        [["order", "=", 1]], {"select": ["username"], "order_by": ["uid"]},
+    )),
+    ("uid,username WHERE uid > 0 ORDER BY username DESC LIMIT 5 OFFSET 5", ParsedQueryCommand(
+        [["uid", ">", 0]], {"select": ["uid", "username"], "order_by": ["-username"], "limit": 5, "offset": 5},
+    )),
 ])
 def test_parse(text, result):
     assert parse(text) == result
@@ -57,7 +80,7 @@ def test_parse(text, result):
     ("WHERE uid == 1", ("Expected end of text, found 'u'\n"
                         " WHERE uid == 1\n"
                         "       ^")),
-    ("#test", ("Expected {column [, column]... | '*'}, found '#'\n"
+    ("#test", ("Expected {COUNT(*) | column [, column]... | '*'}, found '#'\n"
                " #test\n"
                " ^")),
     ("* WHERE smb_account is not None", "Unsupported comparison operator: IsNot"),
@@ -76,3 +99,14 @@ def test_parse_error(text, error):
         parse(text)
 
     assert e.value.args[0] == error
+
+
+def test_parse_is_cached():
+    query_cache.clear()
+
+    result = parse("uid WHERE uid > 0")
+    result.options["select"].append("username")
+    result.filters.clear()
+
+    assert parse("uid WHERE uid > 0") == ParsedQueryCommand([["uid", ">", 0]], {"select": ["uid"]})
+    assert query_cache.hits == 1
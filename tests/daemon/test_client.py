@@ -0,0 +1,80 @@
+# -*- coding=utf-8 -*-
+import os
+import socket
+from unittest.mock import patch
+
+import pytest
+
+from midcli.daemon.client import FallbackRequired, forward
+from midcli.daemon.common import get_peer_uid, is_socket_dir_secure
+
+
+@pytest.fixture()
+def socket_dir(tmp_path):
+    path = tmp_path / "midcli"
+    path.mkdir(mode=0o700)
+    os.chmod(path, 0o700)
+    return path
+
+
+@pytest.mark.parametrize("mode,secure", [
+    (0o700, True),
+    (0o750, False),
+    (0o777, False),
+])
+def test_is_socket_dir_secure(socket_dir, mode, secure):
+    os.chmod(socket_dir, mode)
+
+    assert is_socket_dir_secure(str(socket_dir / "midcli.sock")) == secure
+
+
+def test_is_socket_dir_secure_symlink(socket_dir, tmp_path):
+    os.symlink(socket_dir, tmp_path / "link")
+
+    assert not is_socket_dir_secure(str(tmp_path / "link" / "midcli.sock"))
+
+
+def test_is_socket_dir_secure_missing(tmp_path):
+    assert not is_socket_dir_secure(str(tmp_path / "missing" / "midcli.sock"))
+
+
+def test_forward_refuses_insecure_dir(socket_dir):
+    os.chmod(socket_dir, 0o777)
+    path = str(socket_dir / "midcli.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+    try:
+        with patch("midcli.daemon.client.get_socket_path", lambda: path):
+            with pytest.raises(FallbackRequired):
+                forward(["-c", "system info"])
+    finally:
+        server.close()
+
+
+def test_forward_refuses_server_of_another_user(socket_dir):
+    path = str(socket_dir / "midcli.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+    try:
+        with patch("midcli.daemon.client.get_socket_path", lambda: path):
+            with patch("midcli.daemon.client.get_peer_uid", lambda sock: os.getuid() + 1):
+                with pytest.raises(FallbackRequired):
+                    forward(["--password", "secret", "-c", "system info"])
+
+        # Nothing was sent
+        conn, _ = server.accept()
+        assert conn.recv(1) == b""
+        conn.close()
+    finally:
+        server.close()
+
+
+def test_get_peer_uid():
+    a, b = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        assert get_peer_uid(a) == os.getuid()
+    finally:
+        a.close()
+        b.close()
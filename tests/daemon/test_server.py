@@ -0,0 +1,67 @@
+# -*- coding=utf-8 -*-
+import argparse
+import contextlib
+from unittest.mock import Mock
+
+import pytest
+
+from midcli.daemon.server import _can_serve, _reload_if_upgraded
+
+
+def args(**kwargs):
+    return argparse.Namespace(**{
+        "url": None, "user": None, "password": None, "timeout": 1200, "command": None, "script": None,
+        "interactive": False, "menu": False, "menu_item": None, "daemon": False, "hosts_file": None,
+        **kwargs,
+    })
+
+
+@pytest.mark.parametrize("request_args,result", [
+    (args(command="system info"), True),
+    (args(script="-"), True),
+    (args(), False),
+    (args(command="system info", script="-"), False),
+    (args(command="system info", interactive=True), False),
+    (args(menu=True), False),
+    (args(daemon=True), False),
+    (args(command="system info", url=["ws://nas/api/current"]), False),
+    (args(command="system info", url=["ws://nas1/api/current", "ws://nas2/api/current"]), False),
+    (args(command="system info", hosts_file="hosts"), False),
+    (args(command="system info", timeout=60), False),
+])
+def test_can_serve(request_args, result):
+    assert _can_serve(args(), request_args) == result
+
+
+@pytest.mark.parametrize("version,reloaded", [
+    ("25.04.0", False),
+    ("25.04.1", True),
+])
+def test_reload_if_upgraded(version, reloaded):
+    client = Mock()
+    client.call.return_value = version
+    cli = Mock()
+    cli.context.version = "25.04.0"
+    cli.context.get_client.return_value = contextlib.nullcontext(client)
+    cli.context.namespaces.root.children = []
+
+    _reload_if_upgraded(cli)
+
+    client.call.assert_called_once_with("system.version")
+    if reloaded:
+        cli.context.load_schema.assert_called_once_with(client, version)
+        cli.context.reload.assert_called_once_with()
+    else:
+        cli.context.load_schema.assert_not_called()
+    # Children must not inherit the server connections
+    cli.context.client_pool.close.assert_called_once_with()
+
+
+def test_reload_if_upgraded_keeps_context_on_error():
+    cli = Mock()
+    cli.context.get_client.side_effect = ConnectionRefusedError()
+    cli.context.namespaces.root.children = []
+
+    _reload_if_upgraded(cli)
+
+    cli.context.load_schema.assert_not_called()
@@ -0,0 +1,35 @@
+# -*- coding=utf-8 -*-
+import timeit
+
+from midcli.display_mode.mode.base_table import TableDisplayModeBase
+
+
+def prepare_header_quadratic(objects):
+    # Previous O(rows × keys²) implementation that is used as a reference
+    header = []
+    for object in objects:
+        for prev, key in zip([None] + list(object.keys())[:-1], object.keys()):
+            if key not in header:
+                if prev is None:
+                    header.append(key)
+                else:
+                    header.insert(header.index(prev) + 1, key)
+
+    return header
+
+
+def test_prepare_header_benchmark():
+    # 20000 wide rows with some keys missing in some of them (like `zfs snapshot query` output)
+    objects = [
+        {f"key{j}": j for j in range(60) if j < 2 or (i + j) % 7}
+        for i in range(20000)
+    ]
+    mode = TableDisplayModeBase()
+
+    assert mode._prepare_header(objects) == prepare_header_quadratic(objects)
+
+    quadratic = min(timeit.repeat(lambda: prepare_header_quadratic(objects), number=1, repeat=3))
+    linear = min(timeit.repeat(lambda: mode._prepare_header(objects), number=1, repeat=3))
+    print(f"quadratic: {quadratic:.3f}s, linear: {linear:.3f}s")
+
+    assert linear < quadratic
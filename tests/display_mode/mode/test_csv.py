@@ -0,0 +1,28 @@
+# -*- coding=utf-8 -*-
+from midcli.display_mode.mode.csv import CsvDisplayMode
+
+
+def test_display_table_chunks():
+    mode = CsvDisplayMode()
+    mode.chunk_size = 2
+
+    chunks = list(mode.display([{"id": 1, "name": "a"}, {"id": 2}, {"id": 3, "name": None}]))
+
+    assert chunks == ["id,name\r\n1,a\r\n2,<undefined>\r\n", "3,<null>\r\n"]
+
+
+def test_display_pages_non_uniform_first_page():
+    mode = CsvDisplayMode()
+
+    output = "".join(mode.display_pages(iter([[{"id": 1}, {"id": 2, "name": "b"}], [{"id": 3, "comment": "c"}]])))
+
+    assert output == "id,comment,name\r\n1,<undefined>,<undefined>\r\n2,<undefined>,b\r\n3,c,<undefined>\r\n"
+
+
+def test_display_pages_reports_fields_missing_from_header(capsys):
+    mode = CsvDisplayMode()
+
+    output = "".join(mode.display_pages(iter([[{"id": 1}, {"id": 2}], [{"id": 3, "name": "c"}]])))
+
+    assert output == "id\r\n1\r\n2\r\n3\r\n"
+    assert "'name' first appeared after the first page" in capsys.readouterr().err
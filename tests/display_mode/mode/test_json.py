@@ -0,0 +1,59 @@
+# -*- coding=utf-8 -*-
+from datetime import datetime, timezone
+
+import pytest
+
+from truenas_api_client import ejson
+
+from midcli.display_mode.mode.json import JsonDisplayMode
+from midcli.display_mode.mode.ndjson import NdjsonDisplayMode
+
+
+def display(mode, value):
+    result = mode.display(value)
+    if not isinstance(result, str):
+        result = "".join(result)
+    return result
+
+
+@pytest.mark.parametrize("value,result", [
+    ([], "[]"),
+    ([{"id": 1, "name": None}, {"id": 2, "groups": [1, 2]}], '[\n{"id": 1, "name": null},\n{"id": 2, "groups": [1, 2]}\n]'),
+    ({"id": 1, "enabled": True}, '{"id": 1, "enabled": true}'),
+    ("text", '"text"'),
+    (None, "null"),
+])
+def test_json(value, result):
+    assert display(JsonDisplayMode(), value) == result
+
+
+@pytest.mark.parametrize("value,result", [
+    ([], ""),
+    ([{"id": 1}, {"id": 2}], '{"id": 1}\n{"id": 2}'),
+    ({"id": 1}, '{"id": 1}'),
+    (1, "1"),
+])
+def test_ndjson(value, result):
+    assert display(NdjsonDisplayMode(), value) == result
+
+
+VALUE = [
+    {"id": 1, "created": datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc), "size": 1.5, "name": None},
+    {"id": 2, "created": datetime(2024, 6, 30, 23, 59, 59, tzinfo=timezone.utc), "size": 0.25, "name": "b"},
+]
+
+
+def test_json_is_lossless():
+    result = ejson.loads(display(JsonDisplayMode(), VALUE))
+
+    assert result == VALUE
+    assert [type(row["created"]) for row in result] == [datetime, datetime]
+    assert [type(row["size"]) for row in result] == [float, float]
+
+
+def test_ndjson_is_lossless():
+    result = [ejson.loads(line) for line in display(NdjsonDisplayMode(), VALUE).split("\n")]
+
+    assert result == VALUE
+    assert [type(row["created"]) for row in result] == [datetime, datetime]
+    assert [type(row["size"]) for row in result] == [float, float]
@@ -0,0 +1,50 @@
+# -*- coding=utf-8 -*-
+import pytest
+
+from midcli.display_mode.mode.table import TableDisplayMode
+
+OBJECTS = [
+    {"id": 1, "name": "root", "groups": ["wheel", "operator"], "comment": None},
+    {"id": 1000, "name": "ivan", "groups": [], "comment": "Ivan Ivanov 中文"},
+    {"id": 1001, "name": "anna", "groups": ["builtin_users"], "comment": "Anna"},
+]
+
+
+@pytest.mark.parametrize("objects", [OBJECTS[:1], OBJECTS[1:], OBJECTS])
+def test_stream_table_matches_prettytable(objects):
+    mode = TableDisplayMode()
+    header = mode._prepare_header(objects)
+
+    table = mode.display_table(header, objects)
+
+    assert "".join(mode._stream_table(header, objects)) == table
+
+
+def test_stream_table_truncates_rows_after_sample():
+    mode = TableDisplayMode()
+    mode.stream_threshold = 1
+
+    assert "".join(mode.display_table(["name"], [{"name": "root"}, {"name": "ivan_ivanov"}])) == (
+        "+------+\n"
+        "| name |\n"
+        "+------+\n"
+        "| root |\n"
+        "| i... |\n"
+        "+------+"
+    )
+
+
+def test_display_pages_sample_is_first_page():
+    mode = TableDisplayMode()
+    requested = []
+
+    def pages():
+        for i in range(5):
+            requested.append(i)
+            yield [{"name": f"user{i}"}] * 3
+
+    output = iter(mode.display_pages(pages()))
+    header = next(output)
+
+    assert requested == [0]
+    assert header == "+-------+\n| name  |\n+-------+"
@@ -0,0 +1,50 @@
+# -*- coding=utf-8 -*-
+from unittest.mock import Mock, patch
+
+import pytest
+
+from midcli.call_cache import CallCache, is_read_only_method
+
+
+def test_get():
+    cache = CallCache()
+    compute = Mock(return_value=["wheel"])
+
+    assert cache.get("group", "names", compute) == ["wheel"]
+    assert cache.get("group", "names", compute) == ["wheel"]
+
+    compute.assert_called_once_with()
+
+
+def test_expires():
+    cache = CallCache(ttl=60)
+    compute = Mock(side_effect=[["wheel"], ["wheel", "staff"]])
+
+    with patch("midcli.call_cache.time.monotonic", Mock(return_value=1000)):
+        assert cache.get("group", "names", compute) == ["wheel"]
+    with patch("midcli.call_cache.time.monotonic", Mock(return_value=1061)):
+        assert cache.get("group", "names", compute) == ["wheel", "staff"]
+
+
+def test_invalidate():
+    cache = CallCache()
+    cache.get("group", "names", lambda: ["wheel"])
+    cache.get("user", "names", lambda: ["root"])
+
+    cache.invalidate("group")
+
+    assert cache.get("group", "names", lambda: ["wheel", "staff"]) == ["wheel", "staff"]
+    assert cache.get("user", "names", lambda: []) == ["root"]
+
+
+@pytest.mark.parametrize("name,read_only", [
+    ("group.query", True),
+    ("user.get_instance", True),
+    ("ssh.config", True),
+    ("interface.bridge_members_choices", True),
+    ("group.create", False),
+    ("user.delete", False),
+    ("ssh.update", False),
+])
+def test_is_read_only_method(name, read_only):
+    assert is_read_only_method(name) == read_only
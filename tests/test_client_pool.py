@@ -0,0 +1,88 @@
+# -*- coding=utf-8 -*-
+import threading
+from unittest.mock import Mock
+
+from midcli.client_pool import ClientPool, ClientPoolTimeout
+
+
+def test_reuses_connection():
+    connect = Mock(side_effect=lambda: Mock())
+    pool = ClientPool(connect)
+
+    with pool.client() as c1:
+        pass
+    with pool.client() as c2:
+        pass
+
+    assert c1 is c2
+    assert connect.call_count == 1
+
+
+def test_nested_usage_shares_connection():
+    connect = Mock(side_effect=lambda: Mock())
+    pool = ClientPool(connect, size=1)
+
+    with pool.client() as c1:
+        with pool.client() as c2:
+            assert c1 is c2
+
+    assert connect.call_count == 1
+
+
+def test_reconnects_after_error_if_connection_is_dead():
+    dead = Mock()
+    dead.call.side_effect = ConnectionResetError()
+    alive = Mock()
+    connect = Mock(side_effect=[dead, alive])
+    pool = ClientPool(connect)
+
+    try:
+        with pool.client():
+            raise ConnectionResetError()
+    except ConnectionResetError:
+        pass
+
+    with pool.client() as c:
+        assert c is alive
+
+    dead.close.assert_called_once_with()
+
+
+def test_keeps_connection_after_error_if_connection_is_alive():
+    client = Mock()
+    client.call.return_value = "pong"
+    pool = ClientPool(Mock(return_value=client))
+
+    try:
+        with pool.client():
+            raise ValueError()
+    except ValueError:
+        pass
+
+    with pool.client() as c:
+        assert c is client
+
+    client.call.assert_called_once_with("core.ping")
+
+
+def test_acquire_timeout():
+    pool = ClientPool(Mock(side_effect=lambda: Mock()), size=1, acquire_timeout=0.01)
+    errors = []
+
+    def use():
+        try:
+            with pool.client():
+                pass
+        except ClientPoolTimeout as e:
+            errors.append(e)
+
+    with pool.client():
+        thread = threading.Thread(target=use)
+        thread.start()
+        thread.join()
+
+    assert len(errors) == 1
+
+    # The slot is released after the timeout
+    use()
+    assert len(errors) == 1
@@ -0,0 +1,84 @@
+# -*- coding=utf-8 -*-
+import asyncio
+import threading
+import time
+
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+
+from midcli.completer import DebouncedCompleter
+
+
+class ListCompleter(Completer):
+    def __init__(self, completions, delay=0):
+        self.completions = completions
+        self.delay = delay
+        self.produced = 0
+
+    def get_completions(self, document, complete_event):
+        for text in self.completions:
+            time.sleep(self.delay)
+            self.produced += 1
+            yield Completion(text)
+
+
+async def collect(completer, document):
+    return [c.text async for c in completer.get_completions_async(document, CompleteEvent())]
+
+
+def test_delivers_completions():
+    document = Document("a")
+    completer = DebouncedCompleter(ListCompleter(["a1", "a2"]), delay=0, get_document=lambda: document)
+
+    assert asyncio.run(collect(completer, document)) == ["a1", "a2"]
+    assert completer.metrics == {"requested": 1, "delivered": 1, "cancelled": 0, "timed_out": 0}
+
+
+def test_coalesces_keystrokes():
+    documents = [Document("a")]
+    inner = ListCompleter(["a1"])
+    completer = DebouncedCompleter(inner, delay=0.05, get_document=lambda: documents[-1])
+
+    async def type_and_complete():
+        task = asyncio.ensure_future(collect(completer, documents[-1]))
+        documents.append(Document("ab"))
+        return await task
+
+    assert asyncio.run(type_and_complete()) == []
+    assert inner.produced == 0
+    assert completer.metrics["cancelled"] == 1
+
+
+def test_cancels_in_flight_completion():
+    documents = [Document("a")]
+    inner = ListCompleter(["a1", "a2", "a3", "a4", "a5"], delay=0.1)
+    completer = DebouncedCompleter(inner, delay=0, get_document=lambda: documents[-1])
+
+    async def type_while_completing():
+        task = asyncio.ensure_future(collect(completer, documents[-1]))
+        await asyncio.sleep(0.15)
+        documents.append(Document("ab"))
+        return await task
+
+    assert asyncio.run(type_while_completing()) == []
+    assert completer.metrics["cancelled"] == 1
+
+    # Background thread stops producing outdated completions
+    time.sleep(0.3)
+    assert inner.produced < 5
+
+
+def test_times_out():
+    document = Document("a")
+    event = threading.Event()
+
+    class BlockingCompleter(Completer):
+        def get_completions(self, document, complete_event):
+            event.wait(1)
+            yield Completion("a1")
+
+    completer = DebouncedCompleter(BlockingCompleter(), delay=0, timeout=0.1, get_document=lambda: document)
+
+    assert asyncio.run(collect(completer, document)) == []
+    assert completer.metrics["timed_out"] == 1
+    event.set()
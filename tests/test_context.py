@@ -0,0 +1,55 @@
+# -*- coding=utf-8 -*-
+from unittest.mock import Mock
+
+import pytest
+
+from midcli.command.interface import Command, ProcessInputError
+from midcli.context import Namespace
+
+
+def test_lazy_child_is_constructed_on_first_access():
+    namespace = Namespace(Mock(), "user")
+    factory = Mock(side_effect=lambda: Command(Mock(), namespace, "query"))
+    namespace.add_lazy_child("query", "Query users", factory)
+
+    assert [c.text for c in namespace.get_completions("qu")] == ["query"]
+    factory.assert_not_called()
+
+    command = namespace.find(["query"])
+    assert isinstance(command, Command)
+    assert command.parent is namespace
+    assert namespace.find(["query"]) is command
+    factory.assert_called_once_with()
+
+
+def test_children_materializes_lazy_children():
+    namespace = Namespace(Mock(), "user")
+    namespace.add_lazy_child("query", "Query users", lambda: Command(Mock(), namespace, "query"))
+
+    assert all(isinstance(c, (Command, Namespace)) for c in namespace.children)
+
+
+def test_find_by_alias():
+    namespace = Namespace(Mock(), "user")
+
+    assert namespace.find(["quit"]).name == "exit"
+    assert namespace.find(["missing"]) is None
+
+
+def test_completions_keep_children_order():
+    root = Namespace(Mock(), None)
+    for name in ["system", "service", "sharing", "storage"]:
+        root.add_child(Namespace(Mock(), name))
+
+    assert [c.text for c in root.get_completions("s")] == ["system", "service", "sharing", "storage"]
+    assert [c.text for c in root.get_completions("sh")] == ["sharing"]
+    assert [c.text for c in root.get_completions("l")] == []
+
+
+def test_process_input_unknown_namespace():
+    root = Namespace(Mock(), None)
+
+    with pytest.raises(ProcessInputError) as e:
+        root.process_input("bogus cmd")
+
+    assert e.value.error == "Namespace bogus not found"
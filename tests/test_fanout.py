@@ -0,0 +1,120 @@
+# -*- coding=utf-8 -*-
+import io
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from midcli.command.interface import ProcessInputError
+from midcli.display_mode.mode.csv import CsvDisplayMode
+from midcli.fanout import get_urls, merge_values, read_hosts_file, run_fanout
+
+
+def create_cli_factory(outputs, mode=CsvDisplayMode):
+    def create_cli(url):
+        if isinstance(outputs[url], BaseException):
+            raise outputs[url]
+
+        cli = Mock()
+        cli.context.display_mode_manager.mode = mode()
+
+        def process_input(text):
+            if isinstance(outputs[url], Exception):
+                raise outputs[url]
+
+            cli.context.display_mode_manager.mode.display(outputs[url])
+
+        cli.context.process_input.side_effect = process_input
+        return cli
+
+    return create_cli
+
+
+def test_merges_rows_with_host_column(capsys):
+    create_cli = create_cli_factory({
+        "ws://nas1/api/current": [{"name": "eth0"}, {"name": "eth1"}],
+        "ws://nas2/api/current": [{"name": "eno1"}],
+    })
+
+    assert run_fanout(create_cli, ["ws://nas1/api/current", "ws://nas2/api/current"], "network interface query") == 0
+
+    assert capsys.readouterr().out.split() == [
+        "host,name",
+        "nas1,eth0",
+        "nas1,eth1",
+        "nas2,eno1",
+    ]
+
+
+def test_reports_failures_without_aborting(capsys):
+    create_cli = create_cli_factory({
+        "ws://nas1": SystemExit("middleware is not responding."),
+        "ws://nas2": ProcessInputError("Validation errors:\n* name: Invalid\n"),
+        "ws://nas3": {"hostname": "nas3"},
+    })
+
+    assert run_fanout(create_cli, ["ws://nas1", "ws://nas2", "ws://nas3"], "system info") == 1
+
+    out, err = capsys.readouterr()
+    assert out.split() == ["host,hostname", "nas3,nas3"]
+    assert err == (
+        "nas1: middleware is not responding.\n"
+        "nas2: Validation errors:\n* name: Invalid\n"
+    )
+
+
+def test_bounded_concurrency():
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def create_cli(url):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+        return create_cli_factory({url: []})(url)
+
+    assert run_fanout(create_cli, [f"ws://nas{i}" for i in range(10)], "system info", workers=3) == 0
+    assert max_running == 3
+
+
+@pytest.mark.parametrize("values,rows", [
+    ([[{"a": 1}, {"a": 2}]], [{"host": "nas", "a": 1}, {"host": "nas", "a": 2}]),
+    ([{"a": 1}], [{"host": "nas", "a": 1}]),
+    (["TrueNAS-25.04"], [{"host": "nas", "result": "TrueNAS-25.04"}]),
+    ([None], []),
+])
+def test_merge_values(values, rows):
+    assert merge_values("nas", values) == rows
+
+
+def test_get_urls(tmp_path):
+    hosts_file = tmp_path / "hosts"
+    hosts_file.write_text("# Fleet\nws://nas2/api/current\n\n  ws://nas3/api/current  \n")
+
+    assert read_hosts_file(str(hosts_file)) == ["ws://nas2/api/current", "ws://nas3/api/current"]
+    assert get_urls(Mock(url=["ws://nas1/api/current"], hosts_file=str(hosts_file))) == [
+        "ws://nas1/api/current", "ws://nas2/api/current", "ws://nas3/api/current",
+    ]
+    assert get_urls(Mock(url=None, hosts_file=None)) == []
+
+
+def test_hosts_share_stdin():
+    from midcli.__main__ import main
+
+    argv = ["cli", "--url", "ws://nas1", "--url", "ws://nas2", "-c", "system update x --"]
+    with patch("sys.argv", argv), patch("sys.stdin", io.StringIO("payload: 1\n")):
+        with patch("midcli.__main__.Context") as Context:
+            with patch("midcli.__main__.run_fanout", lambda create_cli, urls, *args: [create_cli(url) for url in urls]):
+                with pytest.raises(SystemExit):
+                    main()
+
+    editors = [c.kwargs["editor"] for c in Context.call_args_list]
+    assert [c.kwargs["url"] for c in Context.call_args_list] == ["ws://nas1", "ws://nas2"]
+    assert [editor.stdin for editor in editors] == ["payload: 1\n", "payload: 1\n"]
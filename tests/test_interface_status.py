@@ -0,0 +1,178 @@
+# -*- coding=utf-8 -*-
+import contextlib
+from unittest.mock import Mock, patch
+
+import pytest
+
+from midcli.before_prompt import BeforePrompt
+from midcli.interface_status import InterfaceStatus, InterfaceStatusMonitor
+
+
+class Stop(BaseException):
+    pass
+
+
+def client_factory(client):
+    @contextlib.contextmanager
+    def factory():
+        yield client
+
+    return factory
+
+
+def client(responses, subscribe=None):
+    c = Mock()
+    c.call.side_effect = lambda method: responses[method]
+    if subscribe is None:
+        c.subscribe.side_effect = Exception("Not supported")
+    else:
+        c.subscribe.side_effect = subscribe
+    return c
+
+
+def run(monitor, waits):
+    """
+    Runs the monitor loop until it has waited `waits` times and returns the wait timeouts.
+    """
+    timeouts = []
+
+    def wait(timeout):
+        timeouts.append(timeout)
+        if len(timeouts) == waits:
+            raise Stop()
+
+    with patch.object(monitor, "_wait", wait):
+        with pytest.raises(Stop):
+            monitor._run()
+
+    return timeouts
+
+
+def test_polling_backoff():
+    c = client({"interface.checkin_waiting": None, "interface.has_pending_changes": False})
+    factory = Mock(side_effect=client_factory(c))
+    monitor = InterfaceStatusMonitor(factory, interval=1, max_interval=8)
+
+    assert run(monitor, 6) == [2, 4, 8, 8, 8, 8]
+    assert c.call.call_count == 12
+    # The monitor keeps its own connection instead of borrowing one for every poll
+    assert factory.call_count == 1
+
+
+def test_reconnects_after_error():
+    c = client({"interface.checkin_waiting": None, "interface.has_pending_changes": True})
+    c.call.side_effect = [ConnectionResetError(), None, True]
+    factory = Mock(side_effect=client_factory(c))
+    monitor = InterfaceStatusMonitor(factory, interval=1, max_interval=8)
+
+    assert run(monitor, 2) == [2, 1]
+    assert factory.call_count == 2
+    assert monitor.status() == InterfaceStatus(None, True)
+
+
+def test_polling_resets_interval_on_change():
+    pending = iter([False, False, True, True])
+    c = client({"interface.checkin_waiting": None})
+    c.call.side_effect = lambda method: None if method == "interface.checkin_waiting" else next(pending)
+    monitor = InterfaceStatusMonitor(client_factory(c), interval=1, max_interval=8)
+
+    assert run(monitor, 4) == [2, 4, 1, 2]
+
+
+def test_subscription_keeps_connection():
+    c = client({"interface.checkin_waiting": None, "interface.has_pending_changes": True}, subscribe=lambda *a: 1)
+    factory = Mock(side_effect=client_factory(c))
+    monitor = InterfaceStatusMonitor(factory, max_interval=30)
+
+    assert run(monitor, 3) == [30, 30, 30]
+    assert factory.call_count == 1
+    assert monitor.status() == InterfaceStatus(None, True)
+
+
+def test_event_wakes_up():
+    monitor = InterfaceStatusMonitor(Mock())
+    c = client({}, subscribe=lambda event, callback: callback("CHANGED", id=1))
+
+    monitor._subscribe(c)
+
+    assert monitor.wake.is_set()
+
+
+def test_refresh_during_update_is_not_lost():
+    monitor = InterfaceStatusMonitor(Mock())
+    c = client({})
+    c.subscribe.side_effect = lambda *args: 1
+
+    def call(method):
+        monitor.refresh()
+
+    c.call.side_effect = call
+    monitor.client_factory = client_factory(c)
+
+    # The next wait must return immediately
+    woken = []
+
+    def wait(timeout):
+        woken.append(monitor.wake.is_set())
+        if len(woken) == 2:
+            raise Stop()
+
+    with patch.object(monitor, "_wait", wait):
+        with pytest.raises(Stop):
+            monitor._run()
+
+    assert woken == [True, True]
+
+
+def test_checkin_polls_every_interval():
+    monitor = InterfaceStatusMonitor(Mock(), interval=1, max_interval=30)
+    monitor.checkin_deadline = 1000
+    monitor.wake = Mock()
+
+    monitor._wait(30)
+
+    monitor.wake.wait.assert_called_once_with(1)
+
+
+def test_checkin_countdown():
+    c = client({"interface.checkin_waiting": 60})
+    monitor = InterfaceStatusMonitor(Mock())
+
+    with patch("midcli.interface_status.time.monotonic", Mock(return_value=1000)):
+        monitor._update(c)
+    with patch("midcli.interface_status.time.monotonic", Mock(return_value=1015.5)):
+        assert monitor.status() == InterfaceStatus(44, False)
+
+
+def test_callbacks():
+    responses = {"interface.checkin_waiting": None, "interface.has_pending_changes": False}
+    c = client(responses)
+    monitor = InterfaceStatusMonitor(Mock())
+    callback = Mock()
+    unsubscribe = monitor.subscribe(callback)
+
+    assert not monitor._update(c)
+    callback.assert_not_called()
+
+    responses["interface.has_pending_changes"] = True
+    assert monitor._update(c)
+    callback.assert_called_once_with()
+
+    unsubscribe()
+    responses["interface.has_pending_changes"] = False
+    assert monitor._update(c)
+    callback.assert_called_once_with()
+
+
+@pytest.mark.parametrize("status,text", [
+    (InterfaceStatus(None, False), ""),
+    (InterfaceStatus(None, True), "You have pending network interface changes. Please run `network interface commit`\n"
+                                  "to apply them.\n"),
+    (InterfaceStatus(30, True), "Network interface changes have been applied. Please run `network interface checkin`\n"
+                                "if the network is still operational or they will be rolled back in 30 seconds.\n"),
+])
+def test_before_prompt(status, text):
+    monitor = Mock()
+    monitor.status.return_value = status
+
+    assert BeforePrompt(monitor).get_before_prompt() == text
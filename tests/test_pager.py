@@ -0,0 +1,22 @@
+# -*- coding=utf-8 -*-
+import os
+from unittest.mock import patch
+
+import pytest
+
+from midcli.pager import echo_via_pager
+
+
+def test_broken_pipe():
+    r, w = os.pipe()
+    os.close(r)
+    with open(w, "w") as stdout:
+        with patch("sys.stdout", stdout):
+            with pytest.raises(SystemExit) as e:
+                echo_via_pager(iter(["a,b\n", "1,2\n"] * 10000))
+
+        assert e.value.code == 1
+        # Further writes (i.e. the flush at exit) go to /dev/null
+        assert os.path.samestat(os.fstat(w), os.stat(os.devnull))
+        stdout.write("x")
+        stdout.flush()
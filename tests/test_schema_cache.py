@@ -0,0 +1,38 @@
+# -*- coding=utf-8 -*-
+import os
+
+from midcli.schema_cache import SchemaCache
+
+METHODS = {"user.query": {"filterable": True}}
+SERVICES = {"user": {"type": "crud"}}
+
+
+def test_load_missing(tmp_path):
+    assert SchemaCache(None, None, str(tmp_path)).load("25.04") is None
+
+
+def test_save_load(tmp_path):
+    SchemaCache(None, None, str(tmp_path)).save("25.04", METHODS, SERVICES)
+
+    assert SchemaCache(None, None, str(tmp_path)).load("25.04") == (METHODS, SERVICES)
+    assert [f for f in os.listdir(tmp_path) if f.startswith(".")] == []
+
+
+def test_version_mismatch(tmp_path):
+    SchemaCache(None, None, str(tmp_path)).save("25.04", METHODS, SERVICES)
+
+    assert SchemaCache(None, None, str(tmp_path)).load("25.10") is None
+
+
+def test_different_url(tmp_path):
+    SchemaCache(None, None, str(tmp_path)).save("25.04", METHODS, SERVICES)
+
+    assert SchemaCache("ws://nas/api/current", None, str(tmp_path)).load("25.04") is None
+
+
+def test_corrupted(tmp_path):
+    cache = SchemaCache(None, None, str(tmp_path))
+    with open(cache.filename, "wb") as f:
+        f.write(b"garbage")
+
+    assert cache.load("25.04") is None
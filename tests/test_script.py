@@ -0,0 +1,89 @@
+# -*- coding=utf-8 -*-
+import io
+import json
+from unittest.mock import Mock, call, patch
+
+import pytest
+
+from midcli.command.interface import ProcessInputError
+from midcli.context import Namespace
+from midcli.script import run_script
+
+
+def failing_context(failing_command):
+    def process_input(text):
+        if text == failing_command:
+            raise ProcessInputError("Error: failed\n")
+
+    return Mock(process_input=Mock(side_effect=process_input))
+
+
+def test_skips_empty_lines_and_comments():
+    context = failing_context(None)
+
+    assert run_script(context, ["system info\n", "\n", "# comment\n", "  service query  \n"]) == 0
+    assert context.process_input.mock_calls == [call("system info"), call("service query")]
+
+
+def test_stop_on_error():
+    context = failing_context("b")
+
+    assert run_script(context, ["a", "b", "c"]) == 1
+    assert context.process_input.mock_calls == [call("a"), call("b")]
+
+
+def test_continue_on_error():
+    context = failing_context("b")
+
+    assert run_script(context, ["a", "b", "c"], stop_on_error=False) == 1
+    assert context.process_input.mock_calls == [call("a"), call("b"), call("c")]
+
+
+def test_results():
+    results = io.StringIO()
+
+    run_script(failing_context("b"), ["a", "", "b"], stop_on_error=False, results=results)
+
+    assert list(map(json.loads, results.getvalue().splitlines())) == [
+        {"line": 1, "command": "a", "status": 0, "error": None},
+        {"line": 3, "command": "b", "status": 1, "error": "Error: failed"},
+    ]
+
+
+def test_unknown_command_fails():
+    root = Namespace(Mock(), None)
+    root.add_child(Namespace(Mock(), "system"))
+    context = Mock(process_input=Mock(side_effect=root.process_input))
+    results = io.StringIO()
+
+    assert run_script(context, ["system", "bogus cmd", "system"], results=results) == 1
+
+    assert context.process_input.mock_calls == [call("system"), call("bogus cmd")]
+    assert list(map(json.loads, results.getvalue().splitlines())) == [
+        {"line": 1, "command": "system", "status": 0, "error": None},
+        {"line": 2, "command": "bogus cmd", "status": 1, "error": "Namespace bogus not found"},
+    ]
+
+
+def test_banners_are_not_displayed():
+    context = Mock(show_banners=True)
+    context.process_input.side_effect = lambda text: show_banners.append(context.show_banners)
+    show_banners = []
+
+    run_script(context, ["network", "interface query"])
+
+    assert show_banners == [False, False]
+    assert context.show_banners is True
+
+
+def test_script_and_command_are_mutually_exclusive(capsys):
+    from midcli.__main__ import main
+
+    with patch("sys.argv", ["cli", "--script", "-", "-c", "system info"]):
+        with patch("midcli.__main__.CLI") as CLI:
+            with pytest.raises(SystemExit) as e:
+                main()
+
+    assert e.value.code == 2
+    assert "mutually exclusive" in capsys.readouterr().err
+    CLI.assert_not_called()
@@ -0,0 +1,36 @@
+# -*- coding=utf-8 -*-
+from unittest.mock import Mock
+
+import pytest
+
+from midcli.utils.cache import LRUCache
+
+
+def test_get():
+    cache = LRUCache()
+    compute = Mock(return_value=1)
+
+    assert cache.get("a", compute) == 1
+    assert cache.get("a", compute) == 1
+
+    compute.assert_called_once_with()
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 256}
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 1)
+    cache.get("c", lambda: 3)
+
+    assert list(cache.data.keys()) == ["a", "c"]
+
+
+def test_does_not_cache_exceptions():
+    cache = LRUCache()
+
+    with pytest.raises(ValueError):
+        cache.get("a", Mock(side_effect=ValueError()))
+
+    assert cache.get("a", lambda: 1) == 1
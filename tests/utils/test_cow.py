@@ -0,0 +1,44 @@
+# -*- coding=utf-8 -*-
+import copy
+
+from midcli.utils.cow import set_path, update_path
+
+METHOD = {
+    "accepts": [
+        {"_name_": "id", "type": "integer"},
+        {"properties": {"group": {"type": "integer"}, "groups": {"type": "array"}}},
+    ],
+    "job": False,
+}
+
+
+def test_set_path():
+    method = copy.deepcopy(METHOD)
+
+    result = set_path(method, ["accepts", 1, "properties", "group", "type"], ["integer", "string"])
+
+    assert result["accepts"][1]["properties"]["group"]["type"] == ["integer", "string"]
+    assert method == METHOD
+
+
+def test_set_path_shares_untouched_items():
+    method = copy.deepcopy(METHOD)
+
+    result = set_path(method, ["accepts", 1, "properties", "group", "type"], ["integer", "string"])
+
+    assert result["accepts"][0] is method["accepts"][0]
+    assert result["accepts"][1]["properties"]["groups"] is method["accepts"][1]["properties"]["groups"]
+    assert result["accepts"] is not method["accepts"]
+
+
+def test_update_path():
+    method = copy.deepcopy(METHOD)
+
+    result = update_path(method, ["accepts", 0], lambda item: {**item, "_name_": "uid_or_username"})
+
+    assert result["accepts"][0] == {"_name_": "uid_or_username", "type": "integer"}
+    assert method == METHOD
+
+
+def test_set_empty_path():
+    assert set_path(METHOD, [], 1) == 1
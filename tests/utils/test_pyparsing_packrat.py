@@ -0,0 +1,58 @@
+# -*- coding=utf-8 -*-
+import timeit
+
+import pyparsing as pp
+import pytest
+
+from midcli.command.common_syntax.parse import autocomplete, command
+from midcli.command.query.grammar import command as query_command
+from midcli.utils.pyparsing import configure_packrat
+
+COMMAND_LINES = [
+    "eth0 mtu=9000 description=\"uplink port\" aliases=\"192.168.0.1/24\",\"10.0.0.1/8\"",
+    "id=6 data={\"a\": [1, 2, {\"b\": null}], \"c\": \"d e\"} --",
+    "1 0x1f 0o17 \"a b\" [1, 2] {\"x\": true} name=value",
+    " ".join(f"k{i}=" + "{\"a\": [1, 2, 3], \"b\": \"x y\"}" for i in range(20)),
+]
+QUERIES = [
+    "uid,username WHERE uid > 1000 and username.startswith('a') ORDER BY uid DESC LIMIT 10",
+    "* WHERE name == 'eth0' or 'tank' in name",
+]
+
+
+def parse_all():
+    return (
+        [command.parseString(line + " ", parseAll=True).asList() for line in COMMAND_LINES] +
+        [autocomplete.parseString(line[:-3] + " ", parseAll=True).asList() for line in COMMAND_LINES] +
+        [query_command.parseString(query, parseAll=True).asList() for query in QUERIES]
+    )
+
+
+@pytest.fixture(autouse=True)
+def packrat():
+    # Packrat is a global pyparsing setting, the other tests must not depend on whether these tests ran before them
+    enabled = pp.ParserElement._packratEnabled
+    cache_size = getattr(pp.ParserElement.packrat_cache, "size", None)
+    pp.ParserElement.disable_memoization()
+    try:
+        yield
+    finally:
+        pp.ParserElement.disable_memoization()
+        if enabled:
+            pp.ParserElement.enable_packrat(cache_size_limit=cache_size)
+
+
+@pytest.mark.parametrize("value", [None, "", "0", "yes"])
+def test_configure_packrat_disabled(value):
+    assert not configure_packrat(value)
+
+
+def test_packrat_benchmark():
+    expected = parse_all()
+    plain = min(timeit.repeat(parse_all, number=3, repeat=3))
+
+    assert configure_packrat("1")
+    assert parse_all() == expected
+    packrat = min(timeit.repeat(parse_all, number=3, repeat=3))
+
+    print(f"plain: {plain / 3 * 1000:.3f}ms, packrat: {packrat / 3 * 1000:.3f}ms")
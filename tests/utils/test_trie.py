@@ -0,0 +1,33 @@
+# -*- coding=utf-8 -*-
+import pytest
+
+from midcli.utils.trie import PrefixTrie
+
+
+@pytest.fixture
+def trie():
+    trie = PrefixTrie()
+    for i, key in enumerate(["create", "credential", "query", "update", "create"]):
+        trie.add(key, i)
+    return trie
+
+
+@pytest.mark.parametrize("key,values", [
+    ("create", [0, 4]),
+    ("cre", []),
+    ("delete", []),
+])
+def test_get(trie, key, values):
+    assert trie.get(key) == values
+
+
+@pytest.mark.parametrize("prefix,values", [
+    ("", [0, 1, 2, 3, 4]),
+    ("cre", [0, 1, 4]),
+    ("cred", [1]),
+    ("query", [2]),
+    ("queryx", []),
+    ("x", []),
+])
+def test_get_prefix(trie, prefix, values):
+    assert sorted(trie.get_prefix(prefix)) == values